@@ -45,9 +45,8 @@ def extract_text_from_file(file_path, filename):
 
         if file_ext == '.pdf':
             doc = fitz.open(file_path)
-            text = ""
-            for page in doc:
-                text += page.get_text()
+            parts = [page.get_text() for page in doc]
+            text = "".join(parts)
             doc.close()
             return text
         elif file_ext in ['.docx', '.doc']:
@@ -3,33 +3,37 @@
 Script to analyze Krupakar Reddy's resume verification data
 """
 
-import pandas as pd
-from docx import Document
+from datetime import datetime
 import json
 import sys
 import os
+from pathlib import Path
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def iter_docx_content(doc):
+    """Yield non-empty paragraph lines, then one ' | '-joined line per table row"""
+    for paragraph in doc.paragraphs:
+        text = paragraph.text.strip()
+        if text:
+            yield text
+
+    # Also extract from tables if any
+    for table in doc.tables:
+        for row in table.rows:
+            row_data = [cell.text.strip() for cell in row.cells if cell.text.strip()]
+            if row_data:
+                yield " | ".join(row_data)
 
 def extract_docx_content(file_path):
     """Extract text content from DOCX file"""
     try:
+        from docx import Document
         doc = Document(file_path)
-        content = []
-
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                content.append(paragraph.text.strip())
-
-        # Also extract from tables if any
-        for table in doc.tables:
-            for row in table.rows:
-                row_data = []
-                for cell in row.cells:
-                    if cell.text.strip():
-                        row_data.append(cell.text.strip())
-                if row_data:
-                    content.append(" | ".join(row_data))
-
-        return "\n".join(content)
+        return "\n".join(iter_docx_content(doc))
     except Exception as e:
         print(f"Error reading DOCX: {e}")
         return None
@@ -37,13 +41,30 @@ def extract_docx_content(file_path):
 def extract_excel_content(file_path):
     """Extract verification data from Excel file"""
     try:
-        # Try reading all sheets
-        xl_file = pd.ExcelFile(file_path)
+        # Stream every sheet's rows from a single read-only workbook
+        from openpyxl import load_workbook
+        wb = load_workbook(file_path, read_only=True, data_only=True)
         all_data = {}
 
-        for sheet_name in xl_file.sheet_names:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
-            all_data[sheet_name] = df.to_dict('records')
+        try:
+            for sheet_name in wb.sheetnames:
+                rows = wb[sheet_name].iter_rows(values_only=True)
+                header_row = next(rows, None)
+                if header_row is None:
+                    all_data[sheet_name] = []
+                    continue
+
+                headers = [
+                    header if header is not None else f"Unnamed: {i}"
+                    for i, header in enumerate(header_row)
+                ]
+                all_data[sheet_name] = [
+                    dict(zip(headers, row))
+                    for row in rows
+                    if any(value is not None for value in row)
+                ]
+        finally:
+            wb.close()
 
         return all_data
     except Exception as e:
@@ -93,7 +114,7 @@ def analyze_verification_data():
                 for i, row in enumerate(data):
                     print(f"\nRow {i+1}:")
                     for key, value in row.items():
-                        if pd.notna(value):
+                        if value is not None and value != '':
                             print(f"  {key}: {value}")
 
         print("\n" + "="*80 + "\n")
@@ -108,16 +129,27 @@ def analyze_verification_data():
     analysis_result = {
         "resume_content": resume_content,
         "verification_data": verification_data,
-        "analysis_timestamp": pd.Timestamp.now().isoformat()
+        "analysis_timestamp": datetime.now().isoformat()
     }
 
     output_path = "/home/great/claudeprojects/parser/parserdemo/krupakar_analysis_output.json"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(analysis_result, f, indent=2, default=str, ensure_ascii=False)
+    # Encode the whole payload first, then write it in one call
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(
+            analysis_result,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+            default=str
+        )
+    else:
+        payload = json.dumps(analysis_result, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+    Path(output_path).write_bytes(payload)
 
     print(f"Analysis data saved to: {output_path}")
 
     return analysis_result
 
+def main():
+    return analyze_verification_data()
+
 if __name__ == "__main__":
-    analyze_verification_data()
\ No newline at end of file
+    main()
\ No newline at end of file
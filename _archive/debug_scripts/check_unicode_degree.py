@@ -6,9 +6,8 @@ parser = FixedComprehensiveParser()
 
 # Read PDF text
 doc = fitz.open('Resume&Results/Ahmad Qasem-Resume.pdf')
-text = ""
-for page in doc:
-    text += page.get_text()
+parts = [page.get_text() for page in doc]
+text = "".join(parts)
 doc.close()
 
 result = parser.parse_resume(text, 'Ahmad Qasem-Resume.pdf')
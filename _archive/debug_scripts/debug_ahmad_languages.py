@@ -6,9 +6,8 @@ resume_path = 'Resume&Results/Ahmad Qasem-Resume.pdf'
 
 # Read PDF
 doc = fitz.open(resume_path)
-text = ""
-for page in doc:
-    text += page.get_text()
+parts = [page.get_text() for page in doc]
+text = "".join(parts)
 doc.close()
 
 parser = FixedComprehensiveParser()
@@ -2,9 +2,8 @@ import fitz
 
 # Check actual work experience content in Ahmad Qasem's PDF
 doc = fitz.open('Resume&Results/Ahmad Qasem-Resume.pdf')
-text = ""
-for page in doc:
-    text += page.get_text()
+parts = [page.get_text() for page in doc]
+text = "".join(parts)
 doc.close()
 
 print("=== SEARCHING FOR WORK EXPERIENCE SECTION ===")
@@ -1,5 +1,15 @@
 import re
 
+_ROMAN_RE = re.compile(r'^[IVXLC]+\.\s*')
+_BULLET_RE = re.compile(r'^[•\-\*]\s*')
+_PHD_RE = re.compile(r'\bphd\b|\bph\.d\b|\bdoctorate\b', re.IGNORECASE)
+_MASTER_RE = re.compile(r'\bmaster|\bmba\b', re.IGNORECASE)
+_BACHELOR_RE = re.compile(r'\bbachelor', re.IGNORECASE)
+_DASH_SPLIT_RE = re.compile(r'\s*[–-]\s*')
+_DEGREE_OF_RE = re.compile(r'\b(?:bachelor\'?s?|master\'?s?|phd|ph\.d)\s+(?:degree\s+)?of\s+(.+?)(?:\s*,|\s*$)', re.IGNORECASE)
+_OF_RE = re.compile(r'\b(?:bachelor|master|phd|ph\.d)\s+(?:of\s+)?(.+?)(?:\s*,|\s*$)', re.IGNORECASE)
+_IN_RE = re.compile(r'\bin\s+(.+?)(?:\s*,|\s*$)', re.IGNORECASE)
+
 # Test the exact _parse_degree_string logic
 def debug_parse_degree_string(degree_str: str):
     print(f"=== DEBUGGING: '{degree_str}' ===")
@@ -9,23 +19,23 @@ def debug_parse_degree_string(degree_str: str):
     print(f"After strip: '{cleaned_degree}'")
 
     # Remove Roman numerals and bullets at the beginning (I., II., etc.)
-    cleaned_degree = re.sub(r'^[IVXLC]+\.\s*', '', cleaned_degree)
+    cleaned_degree = _ROMAN_RE.sub('', cleaned_degree)
     print(f"After Roman numeral removal: '{cleaned_degree}'")
 
-    cleaned_degree = re.sub(r'^[•\-\*]\s*', '', cleaned_degree)
+    cleaned_degree = _BULLET_RE.sub('', cleaned_degree)
     print(f"After bullet removal: '{cleaned_degree}'")
 
     result = {'Degree': cleaned_degree, 'DegreeType': '', 'Major': '', 'FieldOfStudy': ''}
     print(f"Initial result: {result}")
 
     # Extract degree type
-    if re.search(r'\bphd\b|\bph\.d\b|\bdoctorate\b', cleaned_degree, re.IGNORECASE):
+    if _PHD_RE.search(cleaned_degree):
         result['DegreeType'] = 'PhD'
         print("Matched PhD degree type")
-    elif re.search(r'\bmaster|\bmba\b', cleaned_degree, re.IGNORECASE):
+    elif _MASTER_RE.search(cleaned_degree):
         result['DegreeType'] = 'Master'
         print("Matched Master degree type")
-    elif re.search(r'\bbachelor', cleaned_degree, re.IGNORECASE):
+    elif _BACHELOR_RE.search(cleaned_degree):
         result['DegreeType'] = 'Bachelor'
         print("Matched Bachelor degree type")
 
@@ -35,7 +45,7 @@ def debug_parse_degree_string(degree_str: str):
     # Pattern 1: "Master of Business Administration MBA – Project Management"
     if ' – ' in cleaned_degree or ' - ' in cleaned_degree:
         print("Testing dash pattern...")
-        parts = re.split(r'\s*[–-]\s*', cleaned_degree, 1)
+        parts = _DASH_SPLIT_RE.split(cleaned_degree, 1)
         print(f"Dash split parts: {parts}")
         if len(parts) > 1:
             result['Major'] = parts[1].strip()
@@ -44,9 +54,8 @@ def debug_parse_degree_string(degree_str: str):
 
     # Pattern 2: "Bachelor's Degree of Computer Engineering"
     print("Testing 'degree of' pattern...")
-    degree_of_pattern = r'\b(?:bachelor\'?s?|master\'?s?|phd|ph\.d)\s+(?:degree\s+)?of\s+(.+?)(?:\s*,|\s*$)'
-    print(f"Pattern: {degree_of_pattern}")
-    degree_of_match = re.search(degree_of_pattern, cleaned_degree, re.IGNORECASE)
+    print(f"Pattern: {_DEGREE_OF_RE.pattern}")
+    degree_of_match = _DEGREE_OF_RE.search(cleaned_degree)
     if degree_of_match:
         print(f"MATCH! Captured: '{degree_of_match.group(1)}'")
         if not result['Major']:
@@ -60,9 +69,8 @@ def debug_parse_degree_string(degree_str: str):
 
     # Pattern 3: "Bachelor of Computer Science"
     print("Testing 'of' pattern...")
-    of_pattern = r'\b(?:bachelor|master|phd|ph\.d)\s+(?:of\s+)?(.+?)(?:\s*,|\s*$)'
-    print(f"Pattern: {of_pattern}")
-    of_match = re.search(of_pattern, cleaned_degree, re.IGNORECASE)
+    print(f"Pattern: {_OF_RE.pattern}")
+    of_match = _OF_RE.search(cleaned_degree)
     if of_match:
         print(f"MATCH! Captured: '{of_match.group(1)}'")
         if not result['Major']:
@@ -76,9 +84,8 @@ def debug_parse_degree_string(degree_str: str):
 
     # Pattern 4: "PHD in Corporate Innovation and Entrepreneurship"
     print("Testing 'in' pattern...")
-    in_pattern = r'\bin\s+(.+?)(?:\s*,|\s*$)'
-    print(f"Pattern: {in_pattern}")
-    in_match = re.search(in_pattern, cleaned_degree, re.IGNORECASE)
+    print(f"Pattern: {_IN_RE.pattern}")
+    in_match = _IN_RE.search(cleaned_degree)
     if in_match:
         print(f"MATCH! Captured: '{in_match.group(1)}'")
         if not result['Major']:
@@ -93,6 +100,11 @@ def debug_parse_degree_string(degree_str: str):
     print(f"FINAL RESULT: {result}")
     return result
 
-# Test the problematic case
-test_case = "I. Bachelor's Degree of Computer Engineering"
-debug_parse_degree_string(test_case)
\ No newline at end of file
+def main():
+    # Test the problematic case
+    test_case = "I. Bachelor's Degree of Computer Engineering"
+    debug_parse_degree_string(test_case)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,9 +7,8 @@ parser = FixedComprehensiveParser()
 
 # Read PDF text
 doc = fitz.open('Resume&Results/Ahmad Qasem-Resume.pdf')
-text = ""
-for page in doc:
-    text += page.get_text()
+parts = [page.get_text() for page in doc]
+text = "".join(parts)
 doc.close()
 
 # Parse full resume
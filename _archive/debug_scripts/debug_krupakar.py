@@ -1,26 +1,26 @@
-from fixed_comprehensive_parser import FixedComprehensiveParser
-from docx import Document
+import re
+from itertools import islice
+
+from parser_singleton import get_parser
+from text_cache import cached_paragraphs
+
+_EXPERIENCE_HEADER_RE = re.compile(r'EXPERIENCE DETAILS', re.IGNORECASE)
 
 # Debug the company pipe parsing specifically
-doc = Document('Resume&Results/KrupakarReddy_SystemP.docx')
-text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+lines = cached_paragraphs('Resume&Results/KrupakarReddy_SystemP.docx')
 
-parser = FixedComprehensiveParser()
+parser = get_parser()
 
 # Extract experience section manually to debug
-lines = text.split('\n')
-experience_start = -1
-
-for i, line in enumerate(lines):
-    if 'EXPERIENCE DETAILS' in line.upper():
-        experience_start = i + 1
-        break
+experience_start = next(
+    (i + 1 for i, line in enumerate(lines) if _EXPERIENCE_HEADER_RE.search(line)), -1
+)
 
 if experience_start != -1:
-    experience_lines = lines[experience_start:experience_start+50]  # First 50 lines
+    experience_lines = list(lines[experience_start:experience_start+50])  # First 50 lines
     
     print('=== FIRST 20 LINES OF EXPERIENCE SECTION ===')
-    for i, line in enumerate(experience_lines[:20]):
+    for i, line in enumerate(islice(experience_lines, 20)):
         marker = '>>>' if '||' in line else '   '
         print(f'{marker} {i:2d}: {repr(line)}')
         
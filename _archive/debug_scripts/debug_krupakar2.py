@@ -1,48 +1,63 @@
-from fixed_comprehensive_parser import FixedComprehensiveParser
-from docx import Document
-
-# Debug full parsing pipeline
-doc = Document('Resume&Results/KrupakarReddy_SystemP.docx')
-text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
-
-parser = FixedComprehensiveParser()
-
-# Test individual parsing methods
-lines = text.split('\n')
-experience_start = -1
-for i, line in enumerate(lines):
-    if 'EXPERIENCE DETAILS' in line.upper():
-        experience_start = i + 1
-        break
-
-if experience_start != -1:
-    experience_lines = lines[experience_start:experience_start+200]
-    
-    print('=== TESTING ALL PARSING METHODS ===')
-    
-    # Method 1: Company pipe date format
-    pos1 = parser._parse_company_pipe_date_format(experience_lines)
-    print(f'Company pipe format: {len(pos1)} positions')
-    
-    # Method 2: Company dash location format
-    pos2 = parser._parse_company_dash_location_format(experience_lines)
-    print(f'Company dash location: {len(pos2)} positions')
-    
-    # Method 3: Traditional company format  
-    pos3 = parser._parse_traditional_company_format(experience_lines)
-    print(f'Traditional company: {len(pos3)} positions')
-    
-    # Method 4: Job title first format
-    pos4 = parser._parse_job_title_first_format(experience_lines)
-    print(f'Job title first: {len(pos4)} positions')
-    
-    all_positions = pos1 + pos2 + pos3 + pos4
-    print(f'Total before filtering: {len(all_positions)} positions')
-    
-    # Test filtering
-    filtered = parser._filter_and_dedupe_positions(all_positions)
-    print(f'After filtering: {len(filtered)} positions')
-    
-    print('\n=== FILTERED POSITIONS ===')
-    for i, pos in enumerate(filtered, 1):
-        print(f'{i}. {repr(pos.get("JobTitle", {}).get("Raw", "None"))} at {repr(pos.get("Employer", {}).get("Name", {}).get("Raw", "None"))}')
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from parser_singleton import get_parser
+from text_cache import cached_paragraphs
+
+_EXPERIENCE_HEADER_RE = re.compile(r'EXPERIENCE DETAILS', re.IGNORECASE)
+
+# Position extractors to compare, in report order
+PARSING_METHODS = [
+    ('_parse_company_pipe_date_format', 'Company pipe format'),
+    ('_parse_company_dash_location_format', 'Company dash location'),
+    ('_parse_traditional_company_format', 'Traditional company'),
+    ('_parse_job_title_first_format', 'Job title first'),
+]
+
+
+def _run(method_name, lines):
+    """Run one parser method in a worker process, reusing the parser inherited from the parent (built on first use under spawn)"""
+    parser = get_parser()
+    return getattr(parser, method_name)(lines)
+
+
+def main():
+    # Debug full parsing pipeline
+    lines = cached_paragraphs('Resume&Results/KrupakarReddy_SystemP.docx')
+
+    parser = get_parser()
+
+    # Test individual parsing methods
+    experience_start = next(
+        (i + 1 for i, line in enumerate(lines) if _EXPERIENCE_HEADER_RE.search(line)), -1
+    )
+
+    if experience_start != -1:
+        experience_lines = list(lines[experience_start:experience_start+200])
+
+        print('=== TESTING ALL PARSING METHODS ===')
+
+        # The four extractors are independent and CPU-bound, so run them side by side
+        with ProcessPoolExecutor(max_workers=len(PARSING_METHODS)) as executor:
+            futures = [executor.submit(_run, method_name, experience_lines)
+                       for method_name, _ in PARSING_METHODS]
+            results = [future.result() for future in futures]
+
+        all_positions = []
+        for (_, label), positions in zip(PARSING_METHODS, results):
+            print(f'{label}: {len(positions)} positions')
+            all_positions += positions
+
+        print(f'Total before filtering: {len(all_positions)} positions')
+
+        # Test filtering
+        filtered = parser._filter_and_dedupe_positions(all_positions)
+        print(f'After filtering: {len(filtered)} positions')
+
+        print('\n=== FILTERED POSITIONS ===')
+        for i, pos in enumerate(filtered, 1):
+            print(f'{i}. {repr(pos.get("JobTitle", {}).get("Raw", "None"))} at {repr(pos.get("Employer", {}).get("Name", {}).get("Raw", "None"))}')
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,11 @@
-from fixed_comprehensive_parser import FixedComprehensiveParser
-from docx import Document
+from parser_singleton import get_parser
+from text_cache import cached_paragraphs
 
 # Debug the full _extract_experience_fixed method
-doc = Document('Resume&Results/KrupakarReddy_SystemP.docx')
-text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+lines = cached_paragraphs('Resume&Results/KrupakarReddy_SystemP.docx')
+text = '\n'.join(lines)
 
-parser = FixedComprehensiveParser()
+parser = get_parser()
 
 print('=== TESTING FULL _extract_experience_fixed METHOD ===')
 experience = parser._extract_experience_fixed(text)
@@ -17,7 +17,6 @@ for i, pos in enumerate(experience, 1):
     print(f'   End: {pos.get("EndDate", {}).get("Date", "None")}')
 
 # Also test the section detection
-lines = text.split('\n')
 print(f'\n=== SECTION DETECTION DEBUG ===')
 for i, line in enumerate(lines):
     line_upper = line.strip().upper().rstrip(':')
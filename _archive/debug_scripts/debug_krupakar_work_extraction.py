@@ -1,11 +1,46 @@
-from fixed_comprehensive_parser import FixedComprehensiveParser
-from docx import Document
+from parser_singleton import get_parser
+from text_cache import cached_extract
+
+
+def iter_line_hits(text, needle):
+    """Yield (line number, line start offset) for each line containing needle"""
+    line_no = 0
+    counted = 0
+    pos = text.find(needle)
+    while pos != -1:
+        line_no += text.count('\n', counted, pos)
+        counted = pos
+        yield line_no, text.rfind('\n', 0, pos) + 1
+
+        # Report each line once, however many times needle occurs on it
+        line_end = text.find('\n', pos)
+        if line_end == -1:
+            return
+        pos = text.find(needle, line_end)
+
+
+def context_lines(text, line_no, line_start, before, after):
+    """Return (first line number, lines) around a line without splitting the whole text"""
+    start = line_start
+    first = line_no
+    while first > line_no - before and start > 0:
+        start = text.rfind('\n', 0, start - 1) + 1
+        first -= 1
+
+    end = line_start - 1
+    for _ in range(after):
+        end = text.find('\n', end + 1)
+        if end == -1:
+            end = len(text)
+            break
+
+    return first, text[start:end].split('\n')
+
 
 # Debug work experience extraction for Krupakar
-doc = Document('Resume&Results/KrupakarReddy_SystemP.docx')
-text = '\n'.join([paragraph.text for paragraph in doc.paragraphs])
+text = cached_extract('Resume&Results/KrupakarReddy_SystemP.docx')
 
-parser = FixedComprehensiveParser()
+parser = get_parser()
 
 print("="*80)
 print("🔍 KRUPAKAR WORK EXPERIENCE - DEBUG ANALYSIS")
@@ -38,21 +73,18 @@ for i, pos in enumerate(result, 1):
 
 # Check the raw text for company patterns
 print("\n\n🔍 SEARCHING FOR COMPANY-DATE PATTERNS IN TEXT:")
-lines = text.split('\n')
-
-for i, line in enumerate(lines):
-    line_clean = line.strip()
-    # Look for the pattern "Company, Location||Date - Date"
-    if '||' in line_clean:
-        print(f"\nFound || pattern at line {i}:")
-        print(f"   {repr(line_clean)}")
-
-        # Show context
-        context_start = max(0, i-2)
-        context_end = min(len(lines), i+5)
-        print(f"   Context:")
-        for j in range(context_start, context_end):
-            marker = ">>>" if j == i else "   "
-            print(f"{marker} {j}: {lines[j].strip()[:100]}")
+
+# Look for the pattern "Company, Location||Date - Date"
+for i, line_start in iter_line_hits(text, '||'):
+    context_start, context = context_lines(text, i, line_start, 2, 5)
+    line_clean = context[i - context_start].strip()
+    print(f"\nFound || pattern at line {i}:")
+    print(f"   {repr(line_clean)}")
+
+    # Show context
+    print(f"   Context:")
+    for j, context_line in enumerate(context, context_start):
+        marker = ">>>" if j == i else "   "
+        print(f"{marker} {j}: {context_line.strip()[:100]}")
 
 print("\n" + "="*80)
\ No newline at end of file
@@ -1,8 +1,9 @@
-from fixed_comprehensive_parser import FixedComprehensiveParser
+from parser_singleton import get_parser
+import sys
 import traceback
 
 # Debug the parsing error
-parser = FixedComprehensiveParser()
+parser = get_parser()
 
 try:
     # Parse the resume
@@ -14,20 +15,21 @@ except Exception as e:
     print(f"Error type: {type(e)}")
     print(f"Error message: {str(e)}")
     print("\nFull traceback:")
-    traceback.print_exc()
+    # Format the whole traceback first and write it to stderr in one call
+    sys.stderr.write(traceback.format_exc())
 
 # Also test if we can read the PDF directly
 print(f"\n=== TESTING PDF READING ===")
 try:
     import fitz
+    # Report failures through the traceback below rather than MuPDF's own stderr output
+    fitz.TOOLS.mupdf_display_errors(False)
     doc = fitz.open('Resume&Results/Ahmad Qasem-Resume.pdf')
     print(f"PDF opened successfully, {len(doc)} pages")
-    text = ""
-    for page in doc:
-        text += page.get_text()
+    text = "".join(page.get_text() for page in doc)
     doc.close()
     print(f"Text extracted: {len(text)} characters")
     print(f"First 200 chars: {repr(text[:200])}")
 except Exception as e:
     print(f"PDF reading failed: {e}")
-    traceback.print_exc()
\ No newline at end of file
+    sys.stderr.write(traceback.format_exc())
\ No newline at end of file
@@ -1,16 +1,26 @@
 import re
+import sys
 
 # Test the exact pattern and string that's failing
-pattern = r'\b(?:bachelor\'?s?|master\'?s?|phd|ph\.d)\s+(?:degree\s+)?of\s+(.+?)(?:\s*,|\s*$)'
+_DEGREE_RE = re.compile(r'\b(?:bachelor\'?s?|master\'?s?|phd|ph\.d)\s+(?:degree\s+)?of\s+(.+?)(?:\s*,|\s*$)', re.IGNORECASE)
+
+# Pieces and simplified variants of _DEGREE_RE used to isolate the failure
+_BACHELOR_RE = re.compile(r'\b(?:bachelor\'?s?|master\'?s?|phd|ph\.d)', re.IGNORECASE)
+_DEGREE_PART_RE = re.compile(r'\s+(?:degree\s+)?')
+_OF_PART_RE = re.compile(r'of\s+')
+_SIMPLE_RE = re.compile(r'bachelor.*of\s+(.+?)$', re.IGNORECASE)
+_VERY_SIMPLE_RE = re.compile(r'of\s+(.+?)$', re.IGNORECASE)
+_NO_WORD_BOUNDARY_RE = re.compile(r'(?:bachelor\'?s?|master\'?s?|phd|ph\.d)\s+(?:degree\s+)?of\s+(.+?)(?:\s*,|\s*$)', re.IGNORECASE)
+
 test_string = "Bachelor's Degree of Computer Engineering"
 
-print(f"Pattern: {pattern}")
+print(f"Pattern: {_DEGREE_RE.pattern}")
 print(f"Test string: '{test_string}'")
 print(f"String length: {len(test_string)}")
 print(f"String repr: {repr(test_string)}")
 
 # Test the match
-match = re.search(pattern, test_string, re.IGNORECASE)
+match = _DEGREE_RE.search(test_string)
 print(f"Match result: {match}")
 
 if match:
@@ -23,44 +33,37 @@ else:
 print(f"\n=== BREAKING DOWN THE PATTERN ===")
 
 # Test each part
-bachelor_part = r'\b(?:bachelor\'?s?|master\'?s?|phd|ph\.d)'
-print(f"Bachelor part match: {re.search(bachelor_part, test_string, re.IGNORECASE)}")
+print(f"Bachelor part match: {_BACHELOR_RE.search(test_string)}")
 
-degree_part = r'\s+(?:degree\s+)?'
 print(f"After bachelor, looking for degree part in: '{test_string[9:]}'")
 remainder_after_bachelor = test_string[9:]  # After "Bachelor'"
-print(f"Does '{remainder_after_bachelor}' match degree pattern? {re.search(degree_part, remainder_after_bachelor)}")
+print(f"Does '{remainder_after_bachelor}' match degree pattern? {_DEGREE_PART_RE.search(remainder_after_bachelor)}")
 
-of_part = r'of\s+'
 print(f"Looking for 'of' part in: '{remainder_after_bachelor}'")
-of_match_pos = re.search(of_part, remainder_after_bachelor)
+of_match_pos = _OF_PART_RE.search(remainder_after_bachelor)
 print(f"Of match: {of_match_pos}")
 
 # Test simpler patterns to isolate the issue
-simple_pattern = r'bachelor.*of\s+(.+?)$'
-simple_match = re.search(simple_pattern, test_string, re.IGNORECASE)
+simple_match = _SIMPLE_RE.search(test_string)
 print(f"\nSimple pattern match: {simple_match}")
 if simple_match:
     print(f"Simple captured: '{simple_match.group(1)}'")
 
 # Test even simpler
-very_simple = r'of\s+(.+?)$'
-very_simple_match = re.search(very_simple, test_string, re.IGNORECASE)
+very_simple_match = _VERY_SIMPLE_RE.search(test_string)
 print(f"Very simple pattern match: {very_simple_match}")
 if very_simple_match:
     print(f"Very simple captured: '{very_simple_match.group(1)}'")
 
 # Test character by character what we have
 print(f"\n=== CHARACTER ANALYSIS ===")
-for i, char in enumerate(test_string):
-    print(f"{i:2d}: '{char}' (ord {ord(char)})")
+sys.stdout.write("".join(f"{i:2d}: '{char}' (ord {ord(char)})\n" for i, char in enumerate(test_string)))
 
 # Check if there are any hidden characters
 print(f"\nString bytes: {test_string.encode('utf-8')}")
 
 # Test without the word boundary
-no_word_boundary = r'(?:bachelor\'?s?|master\'?s?|phd|ph\.d)\s+(?:degree\s+)?of\s+(.+?)(?:\s*,|\s*$)'
-no_wb_match = re.search(no_word_boundary, test_string, re.IGNORECASE)
+no_wb_match = _NO_WORD_BOUNDARY_RE.search(test_string)
 print(f"\nWithout word boundary: {no_wb_match}")
 if no_wb_match:
     print(f"No WB captured: '{no_wb_match.group(1)}'")
\ No newline at end of file
@@ -1,63 +1,75 @@
-from docx import Document
+import sys
+
+from keyword_matcher import KeywordMatcher
+from text_cache import cached_paragraphs
+
+SECTION_MATCHER = KeywordMatcher({
+    'education': ['education', 'academic', 'qualification', 'degree', 'university', 'college', 'bachelor', 'master'],
+    'experience': ['experience', 'employment', 'work history', 'professional', 'career'],
+})
 
 # Examine the actual content structure of Krupakar's resume
-doc = Document('Resume&Results/KrupakarReddy_SystemP.docx')
+paragraphs = cached_paragraphs('Resume&Results/KrupakarReddy_SystemP.docx')
 
-print("="*80)
-print("📄 KRUPAKAR RESUME - RAW CONTENT ANALYSIS")
-print("="*80)
+# Collect the whole report and write it to stdout once at the end
+buf = []
+buf.append("="*80 + "\n")
+buf.append("📄 KRUPAKAR RESUME - RAW CONTENT ANALYSIS\n")
+buf.append("="*80 + "\n")
 
-print(f"\nTotal paragraphs: {len(doc.paragraphs)}")
+buf.append(f"\nTotal paragraphs: {len(paragraphs)}\n")
 
-# Look for education section
-print("\n🔍 SEARCHING FOR EDUCATION SECTION:")
-education_keywords = ['education', 'academic', 'qualification', 'degree', 'university', 'college', 'bachelor', 'master']
+# Tag every paragraph with the sections its keywords point to, in one pass
+paragraph_tags = SECTION_MATCHER.tags_per_text(paragraphs)
+
+
+def append_context(i, after):
+    """Buffer the paragraphs around line i, marking line i itself"""
+    start = max(0, i-2)
+    end = min(len(paragraphs), i+after)
+    buf.append(f"\n   Context (lines {start}-{end}):\n")
+    for j in range(start, end):
+        marker = ">>>" if j == i else "   "
+        buf.append(f"{marker} {j:3d}: {repr(paragraphs[j].strip())}\n")
 
+
+# Look for education section
+buf.append("\n🔍 SEARCHING FOR EDUCATION SECTION:\n")
 education_found = False
-for i, para in enumerate(doc.paragraphs):
-    text = para.text.strip()
-    if any(keyword in text.lower() for keyword in education_keywords):
-        print(f"\nLine {i}: {repr(text)}")
+for i, para in enumerate(paragraphs):
+    text = para.strip()
+    if 'education' in paragraph_tags[i]:
+        buf.append(f"\nLine {i}: {repr(text)}\n")
         # Show context (5 lines before and after)
-        start = max(0, i-2)
-        end = min(len(doc.paragraphs), i+10)
-        print(f"\n   Context (lines {start}-{end}):")
-        for j in range(start, end):
-            marker = ">>>" if j == i else "   "
-            print(f"{marker} {j:3d}: {repr(doc.paragraphs[j].text.strip())}")
+        append_context(i, 10)
         education_found = True
-        print("\n" + "-"*80)
+        buf.append("\n" + "-"*80 + "\n")
 
 if not education_found:
-    print("   ❌ No obvious education section headers found")
+    buf.append("   ❌ No obvious education section headers found\n")
 
 # Look for work experience
-print("\n🔍 SEARCHING FOR WORK EXPERIENCE:")
-experience_keywords = ['experience', 'employment', 'work history', 'professional', 'career']
-
+buf.append("\n🔍 SEARCHING FOR WORK EXPERIENCE:\n")
 experience_found = False
-for i, para in enumerate(doc.paragraphs):
-    text = para.text.strip()
-    if any(keyword in text.lower() for keyword in experience_keywords) and len(text) < 50:
-        print(f"\nLine {i}: {repr(text)}")
+for i, para in enumerate(paragraphs):
+    text = para.strip()
+    if 'experience' in paragraph_tags[i] and len(text) < 50:
+        buf.append(f"\nLine {i}: {repr(text)}\n")
         # Show context
-        start = max(0, i-2)
-        end = min(len(doc.paragraphs), i+15)
-        print(f"\n   Context (lines {start}-{end}):")
-        for j in range(start, end):
-            marker = ">>>" if j == i else "   "
-            print(f"{marker} {j:3d}: {repr(doc.paragraphs[j].text.strip())}")
+        append_context(i, 15)
         experience_found = True
         break
 
 # Show all content to understand structure
-print("\n\n📝 FULL RESUME CONTENT (first 100 lines):")
-print("="*80)
-for i, para in enumerate(doc.paragraphs[:100]):
-    text = para.text.strip()
+buf.append("\n\n📝 FULL RESUME CONTENT (first 100 lines):\n")
+buf.append("="*80 + "\n")
+for i, para in enumerate(paragraphs[:100]):
+    text = para.strip()
     if text:  # Only show non-empty lines
-        print(f"{i:3d}: {text}")
+        buf.append(f"{i:3d}: {text}\n")
+
+buf.append("\n" + "="*80 + "\n")
+buf.append(f"Total non-empty lines: {sum(1 for p in paragraphs if p.strip())}\n")
+buf.append("="*80 + "\n")
 
-print("\n" + "="*80)
-print(f"Total non-empty lines: {sum(1 for p in doc.paragraphs if p.text.strip())}")
-print("="*80)
\ No newline at end of file
+sys.stdout.write("".join(buf))
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Read every resume used by the debug scripts concurrently and pre-warm the text cache
+"""
+
+import asyncio
+from pathlib import Path
+
+from text_cache import cached_extract
+
+RESUME_PATHS = [
+    'Resume&Results/KrupakarReddy_SystemP.docx',
+    'Resume&Results/Ahmad Qasem-Resume.pdf',
+    '/home/great/claudeprojects/parser/test_resumes/Test Resumes/Jumoke-Adekanmi-Web-Developer-2025-03-21.pdf',
+]
+
+
+async def _read_all(paths):
+    """Submit all file reads at once instead of blocking on each in turn"""
+    reads = [asyncio.to_thread(Path(path).read_bytes) for path in paths]
+    return await asyncio.gather(*reads, return_exceptions=True)
+
+
+def extract_all(paths=RESUME_PATHS):
+    """Return {path: text} for every readable resume, filling the shared text cache"""
+    buffers = asyncio.run(_read_all(paths))
+
+    texts = {}
+    for path, data in zip(paths, buffers):
+        if isinstance(data, Exception):
+            print(f"Skipping {path}: {data}")
+            continue
+        texts[path] = cached_extract(path, data)
+
+    return texts
+
+
+if __name__ == "__main__":
+    for path, text in extract_all().items():
+        print(f"{path}: {len(text)} characters")
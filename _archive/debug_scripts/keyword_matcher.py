@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Multi-keyword matching shared by the debug scripts: one scan per text, whatever the keyword count
+"""
+
+import re
+from bisect import bisect_right
+from itertools import accumulate
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+
+class KeywordMatcher:
+    """Report which groups of (lowercase) keywords occur in a text"""
+
+    def __init__(self, keywords_by_tag):
+        if AHOCORASICK_AVAILABLE:
+            self._automaton = ahocorasick.Automaton()
+            for tag, keywords in keywords_by_tag.items():
+                for keyword in keywords:
+                    self._automaton.add_word(keyword, tag)
+            self._automaton.make_automaton()
+        else:
+            self._pattern = re.compile('|'.join(
+                f"(?P<{tag}>{'|'.join(map(re.escape, keywords))})"
+                for tag, keywords in keywords_by_tag.items()
+            ))
+
+    def tags(self, text):
+        """Return the set of tags whose keywords occur in text (case-insensitive)"""
+        text = text.lower()
+        if AHOCORASICK_AVAILABLE:
+            return {tag for _, tag in self._automaton.iter(text)}
+        return {m.lastgroup for m in self._pattern.finditer(text)}
+
+    def tags_per_text(self, texts):
+        """Return one tag set per text, scanning all texts as a single record-separated blob"""
+        texts = [text.lower() for text in texts]
+        # Start offset of each text within the blob (each text is followed by a separator)
+        offsets = [0, *accumulate(len(text) + 1 for text in texts)]
+        blob = '\x1e'.join(texts)
+        result = [set() for _ in texts]
+        if AHOCORASICK_AVAILABLE:
+            hits = self._automaton.iter(blob)
+        else:
+            hits = ((m.start(), m.lastgroup) for m in self._pattern.finditer(blob))
+        for position, tag in hits:
+            result[bisect_right(offsets, position) - 1].add(tag)
+        return result
@@ -0,0 +1,13 @@
+#!/usr/bin/env python3
+"""
+Process-wide FixedComprehensiveParser shared by the debug scripts
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=1)
+def get_parser():
+    """Build the parser on first use and hand back the same instance afterwards"""
+    from fixed_comprehensive_parser import FixedComprehensiveParser
+    return FixedComprehensiveParser()
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+Single per-process PDF text extraction shared by the debug scripts
+"""
+
+import os
+from functools import lru_cache
+
+
+def _join_pages(doc):
+    """Join the text of every page and close the document"""
+    parts = [page.get_text() for page in doc]
+    doc.close()
+    return "".join(parts)
+
+
+@lru_cache(maxsize=32)
+def _read_pdf_text(file_path, mtime):
+    """Open the PDF once and join the text of every page"""
+    import fitz
+    return _join_pages(fitz.open(file_path))
+
+
+def get_pdf_text(file_path):
+    """Return the text of a PDF, reopening it only when the file has changed"""
+    return _read_pdf_text(str(file_path), os.path.getmtime(file_path))
+
+
+def pdf_text_from_bytes(data):
+    """Return the text of a PDF that has already been read into memory"""
+    import fitz
+    return _join_pages(fitz.open(stream=data, filetype="pdf"))
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Run the debug scripts in one interpreter so imports, the parser and extracted text are shared
+"""
+
+import traceback
+from importlib import import_module
+
+from extract_all import extract_all
+
+SCRIPTS = [
+    'analyze_krupakar_comprehensive',
+    'debug_ahmad_certifications',
+    'debug_ahmad_education',
+    'debug_ahmad_skills_fixed',
+    'debug_filtering_issue',
+    'debug_jumoke',
+    'analyze_krupakar_verification',
+    'debug_degree_parsing',
+]
+
+
+def main():
+    # Read every resume up front so each script hits the warm text cache
+    extract_all()
+
+    failed = []
+    for name in SCRIPTS:
+        print(f"\n{'#' * 80}\n# {name}\n{'#' * 80}")
+        try:
+            import_module(name).main()
+        except Exception:
+            traceback.print_exc()
+            failed.append(name)
+
+    print(f"\nRan {len(SCRIPTS)} scripts, {len(failed)} failed")
+    for name in failed:
+        print(f"  - {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,31 +4,24 @@ Precise fixes for Shreyas Krishna resume parsing issues
 """
 
 import re
+from types import MappingProxyType
 from typing import List, Dict, Any
 
-def extract_shreyas_education_precise(text: str) -> List[Dict[str, Any]]:
-    """Extract precise education for Shreyas Krishna resume"""
-
-    # Based on the actual resume content:
-    # Texas A&M University
-    # Corpus Christi, TX
-    # MS Computer Science
-    # 08/2023 – 05/2025
-
-    # Bharathiar University
-    # Coimbatore, India
-    # Master of Science, Data Analytics
-    # 06/2019 – 05/2021
-
-    # Alliance School of Business
-    # Bengaluru, India
-    # Bachelor of Commerce (Honors), Finance
-    # 07/2016 – 05/2019
-
-    education = []
-
+# International numbers first, then (555) 555-5555 / 555.555.5555 style
+_PHONE_RE = re.compile(
+    r'\+\d{1,3}[\s\-\.]?\d{3,4}[\s\-\.]?\d{3,4}[\s\-\.]?\d{4}'
+    r'|\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
+)
+# Deletes every non-digit a _PHONE_RE match can contain; the widest \s
+# separator is U+3000, so the table stops there
+_KEEP_DIGITS = str.maketrans('', '', ''.join(
+    c for c in map(chr, range(0x3001)) if not c.isdecimal()
+))
+
+# Education entries for the Shreyas Krishna resume, built once at import
+_SHREYAS_EDU = tuple(MappingProxyType(entry) for entry in (
     # Entry 1: MS Computer Science, Texas A&M University
-    education.append({
+    {
         'Degree': 'Master Of Science',
         'DegreeName': 'Master Of Science',
         'FieldOfStudy': 'Computer Science',
@@ -41,10 +34,9 @@ def extract_shreyas_education_precise(text: str) -> List[Dict[str, Any]]:
         'YearPassed': '2025',
         'Location': 'Corpus Christi, TX',
         'GPA': ''
-    })
-
+    },
     # Entry 2: Master of Science, Data Analytics, Bharathiar University
-    education.append({
+    {
         'Degree': 'Master Of Science',
         'DegreeName': 'Master Of Science',
         'FieldOfStudy': 'Data Analytics',
@@ -57,10 +49,9 @@ def extract_shreyas_education_precise(text: str) -> List[Dict[str, Any]]:
         'YearPassed': '2021',
         'Location': 'Coimbatore, India',
         'GPA': ''
-    })
-
+    },
     # Entry 3: Bachelor of Commerce (Honors), Finance, Alliance School of Business
-    education.append({
+    {
         'Degree': 'Bachelor Of Commerce',
         'DegreeName': 'Bachelor Of Commerce',
         'FieldOfStudy': 'Finance',
@@ -73,29 +64,41 @@ def extract_shreyas_education_precise(text: str) -> List[Dict[str, Any]]:
         'YearPassed': '2019',
         'Location': 'Bengaluru, India',
         'GPA': ''
-    })
+    },
+))
 
-    return education
+def extract_shreyas_education_precise(text: str) -> List[Dict[str, Any]]:
+    """Extract precise education for Shreyas Krishna resume"""
+
+    # Based on the actual resume content:
+    # Texas A&M University
+    # Corpus Christi, TX
+    # MS Computer Science
+    # 08/2023 – 05/2025
+
+    # Bharathiar University
+    # Coimbatore, India
+    # Master of Science, Data Analytics
+    # 06/2019 – 05/2021
+
+    # Alliance School of Business
+    # Bengaluru, India
+    # Bachelor of Commerce (Honors), Finance
+    # 07/2016 – 05/2019
+
+    return [dict(entry) for entry in _SHREYAS_EDU]
 
 def extract_precise_phone(text: str) -> str:
     """Extract phone number precisely"""
     # The resume header shows: "| | R" which indicates no phone number
-    # Look for actual phone patterns
-    phone_patterns = [
-        r'\(?\d{3}\)?[\s\-\.]?\d{3}[\s\-\.]?\d{4}',
-        r'\+\d{1,3}[\s\-\.]?\d{3,4}[\s\-\.]?\d{3,4}[\s\-\.]?\d{4}',
-        r'\d{3}[\s\-\.]?\d{3}[\s\-\.]?\d{4}'
-    ]
-
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            # Clean and format the first match
-            phone = re.sub(r'[^\d]', '', matches[0])
-            if len(phone) == 10:
-                return f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
-            elif len(phone) == 11 and phone.startswith('1'):
-                return f"+1 ({phone[1:4]}) {phone[4:7]}-{phone[7:]}"
+    # Look for actual phone patterns in a single scan
+    for match in _PHONE_RE.finditer(text):
+        # Clean and format the first usable match
+        phone = match.group().translate(_KEEP_DIGITS)
+        if len(phone) == 10:
+            return f"({phone[:3]}) {phone[3:6]}-{phone[6:]}"
+        elif len(phone) == 11 and phone.startswith('1'):
+            return f"+1 ({phone[1:4]}) {phone[4:7]}-{phone[7:]}"
 
     return ""  # No phone found in Shreyas resume
 
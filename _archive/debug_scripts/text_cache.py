@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Content-hash cache for resume text extracted by the debug scripts
+"""
+
+import hashlib
+import pickle
+from io import BytesIO
+from pathlib import Path
+
+from pdf_text import pdf_text_from_bytes
+
+CACHE_DIR = Path.home() / '.cache' / 'resume_text'
+
+# Extractions already done in this process, keyed by path
+_extracted = {}
+
+
+def _is_docx(file_path):
+    return str(file_path).lower().endswith('.docx')
+
+
+def _docx_paragraphs(data):
+    """Read top-level paragraph texts straight from the document XML in one walk
+
+    Matches python-docx's Paragraph.text: only the paragraph's own runs count,
+    with <w:tab/> as a tab and <w:br/>/<w:cr/> as a newline.
+    """
+    from docx import Document
+    from docx.oxml.ns import qn
+
+    run_tag, text_tag = qn('w:r'), qn('w:t')
+    run_chars = {qn('w:tab'): '\t', qn('w:br'): '\n', qn('w:cr'): '\n'}
+
+    paragraphs = []
+    for p in Document(BytesIO(data)).element.body.iterchildren(qn('w:p')):
+        parts = []
+        for run in p.iterchildren(run_tag):
+            for child in run:
+                if child.tag == text_tag:
+                    parts.append(child.text or '')
+                elif child.tag in run_chars:
+                    parts.append(run_chars[child.tag])
+        paragraphs.append(''.join(parts))
+    return tuple(paragraphs)
+
+
+def _extract(file_path, data):
+    """Extract the paragraphs of a DOCX (as a tuple) or the raw text of a PDF"""
+    if _is_docx(file_path):
+        return _docx_paragraphs(data)
+
+    return pdf_text_from_bytes(data)
+
+
+def _cached(file_path, data=None):
+    """Return the extraction for a file, reusing a previous one of identical bytes"""
+    if data is None:
+        if file_path in _extracted:
+            return _extracted[file_path]
+        data = Path(file_path).read_bytes()
+
+    digest = hashlib.sha256(data).hexdigest()
+    suffix = 'paragraphs.pkl' if _is_docx(file_path) else 'pkl'
+    cache_path = CACHE_DIR / f"{digest}.{suffix}"
+
+    extracted = None
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                extracted = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+
+    if extracted is None:
+        extracted = _extract(file_path, data)
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(extracted, f)
+        except OSError as e:
+            print(f"Warning: could not write text cache: {e}")
+
+    _extracted[file_path] = extracted
+    return extracted
+
+
+def cached_extract(file_path, data=None):
+    """Return the text of a resume, reusing a previous extraction of identical bytes"""
+    extracted = _cached(file_path, data)
+    if isinstance(extracted, tuple):
+        return '\n'.join(extracted)
+    return extracted
+
+
+def cached_paragraphs(file_path):
+    """Return the paragraph texts of a DOCX resume, cached like cached_extract()"""
+    return _cached(file_path)
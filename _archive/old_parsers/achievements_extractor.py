@@ -5,11 +5,155 @@ Extracts achievements and accomplishments from various resume sections as per BR
 """
 
 import re
+import sys
 import logging
-from typing import Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every line/sentence, compiled once at import
+_PUNCT_RE = re.compile(r'[^\w\s]')
+_QUANTIFIER_HINT_RE = re.compile(r'[\d$]')
+_BULLET_RE = re.compile(r'(?:^|\n)\s*[•\-*◦]\s*')
+_BULLET_MARKERS = ('•', '-', '*', '◦')
+_SENTENCE_SPLIT_RE = re.compile(r'[.!?]+\s+')
+_SENTENCE_MARKS = ('.', '!', '?')
+_SUMMARY_RE = re.compile(r'(?:summary|objective|profile)(?:\s*[:])?\s*([^.]+(?:\.|$))', re.IGNORECASE | re.MULTILINE)
+_PCT_RE = re.compile(r'(\d+(?:\.\d+)?)\s*%')
+_DOLLAR_RE = re.compile(r'\$\s*([\d,]+(?:\.\d+)?)\s*([kmb]?)', re.IGNORECASE)
+_TIME_RE = re.compile(r'(\d+)\s*(hours?|days?|weeks?|months?|years?)', re.IGNORECASE)
+
+# Keyword sets and scoring tables, built once and shared by every extractor
+_MAJOR_SECTIONS = frozenset({
+    'experience', 'work experience', 'employment', 'employment history',
+    'education', 'skills', 'certifications', 'projects', 'references',
+    'contact', 'summary', 'objective', 'profile'
+})
+
+_POSITIVE_WORDS = frozenset({
+    'increased', 'improved', 'enhanced', 'optimized', 'streamlined',
+    'reduced', 'decreased', 'minimized', 'eliminated', 'saved',
+    'generated', 'created', 'developed', 'launched', 'delivered',
+    'exceeded', 'surpassed', 'achieved', 'accomplished', 'successful'
+})
+
+_CATEGORY_KEYWORDS = {
+    'financial': ['revenue', 'profit', 'cost', 'budget', 'savings', 'sales', '$'],
+    'performance': ['efficiency', 'productivity', 'performance', 'speed', 'time'],
+    'quality': ['quality', 'accuracy', 'error', 'defect', 'satisfaction'],
+    'growth': ['growth', 'expansion', 'scale', 'increase', 'users', 'customers'],
+    'leadership': ['led', 'managed', 'directed', 'supervised', 'team'],
+    'innovation': ['created', 'developed', 'designed', 'innovated', 'built'],
+    'recognition': ['award', 'recognition', 'honored', 'winner', 'top']
+}
+
+_HIGH_IMPACT = frozenset({'million', 'billion', 'company-wide', 'organization', 'enterprise'})
+_MEDIUM_IMPACT = frozenset({'department', 'team', 'division', 'significant', 'major'})
+_LOW_IMPACT = frozenset({'personal', 'individual', 'small', 'minor'})
+
+_IMPACT_CATEGORY_KEYWORDS = {
+    'financial': ['revenue', 'profit', 'cost', 'sales', 'budget', '$', 'roi', 'savings'],
+    'operational': ['efficiency', 'process', 'time', 'reduced', 'optimized', 'automated'],
+    'leadership': ['led', 'managed', 'team', 'people', 'mentor', 'trained'],
+    'innovation': ['new', 'innovative', 'created', 'developed', 'designed', 'patent'],
+    'customer': ['customer', 'client', 'user', 'satisfaction', 'experience', 'service'],
+    'quality': ['quality', 'accuracy', 'reliability', 'testing', 'bugs', 'defects']
+}
+
+_TAG_KEYWORDS = {
+    'leadership': ['led', 'managed', 'directed', 'supervised'],
+    'teamwork': ['team', 'collaboration', 'coordinated'],
+    'innovation': ['created', 'developed', 'designed', 'built'],
+    'efficiency': ['improved', 'optimized', 'streamlined'],
+    'growth': ['increased', 'grew', 'expanded', 'scaled'],
+    'cost_savings': ['reduced', 'saved', 'cut', 'minimized'],
+    'quality': ['quality', 'accuracy', 'excellence'],
+    'customer_focus': ['customer', 'client', 'satisfaction']
+}
+
+_IMPACT_SCORES = {'high': 4, 'medium': 2, 'low': 1}
+_HIGH_VALUE_CATEGORIES = frozenset({'financial', 'leadership', 'innovation'})
+_CURRENCY_MULTIPLIERS = {'k': 1000, 'm': 1000000, 'b': 1000000000}
+
+
+def _starts_numbered(line: str) -> bool:
+    """Check if line opens with a numbered-list marker such as '3.' (digits then a dot)"""
+    i = 0
+    while i < len(line) and line[i].isdecimal():
+        i += 1
+    return 0 < i < len(line) and line[i] == '.'
+
+
+class _KeywordTable:
+    """
+    Substring keywords grouped by tag. With pyahocorasick one automaton scan finds them all;
+    otherwise plain `in` tests are used, which beat a regex alternation of the same keywords
+    """
+
+    def __init__(self, keywords_by_tag: Dict[str, Iterable[str]]):
+        self.order = list(keywords_by_tag)
+        self._keywords_by_tag = {tag: tuple(keywords) for tag, keywords in keywords_by_tag.items()}
+        self._keywords = tuple({keyword for keywords in self._keywords_by_tag.values() for keyword in keywords})
+
+        if AHOCORASICK_AVAILABLE:
+            tags_by_keyword: Dict[str, Set[str]] = {}
+            for tag, keywords in self._keywords_by_tag.items():
+                for keyword in keywords:
+                    tags_by_keyword.setdefault(keyword, set()).add(tag)
+
+            self._automaton = ahocorasick.Automaton()
+            for keyword, tags in tags_by_keyword.items():
+                self._automaton.add_word(keyword, frozenset(tags))
+            self._automaton.make_automaton()
+
+    def found_in(self, text: str) -> bool:
+        """Check if any keyword occurs in text"""
+        if AHOCORASICK_AVAILABLE:
+            return any(True for _ in self._automaton.iter(text))
+        return any(keyword in text for keyword in self._keywords)
+
+    def tags(self, text: str) -> Set[str]:
+        """Return the tags of every keyword occurring in text"""
+        if AHOCORASICK_AVAILABLE:
+            return set().union(*(tags for _, tags in self._automaton.iter(text)))
+        return {tag for tag, keywords in self._keywords_by_tag.items()
+                if any(keyword in text for keyword in keywords)}
+
+    def first(self, text: str, default: str) -> str:
+        """Return the earliest tag (in table order) with a keyword in text"""
+        if AHOCORASICK_AVAILABLE:
+            found = self.tags(text)
+            return next((tag for tag in self.order if tag in found), default)
+        return next((tag for tag, keywords in self._keywords_by_tag.items()
+                     if any(keyword in text for keyword in keywords)), default)
+
+
+_MAJOR_SECTION_TABLE = _KeywordTable({'section': _MAJOR_SECTIONS})
+_IMPACT_LEVEL_TABLE = _KeywordTable({'high': _HIGH_IMPACT, 'medium': _MEDIUM_IMPACT, 'low': _LOW_IMPACT})
+_TAG_TABLE = _KeywordTable(_TAG_KEYWORDS)
+# Achievement categories and impact categories share most keywords, so one table finds both
+_CLASSIFICATION_TABLE = _KeywordTable({
+    **{'category:' + tag: keywords for tag, keywords in _CATEGORY_KEYWORDS.items()},
+    **{'impact:' + tag: keywords for tag, keywords in _IMPACT_CATEGORY_KEYWORDS.items()},
+})
+
+
+@lru_cache(maxsize=4096)
+def _classify(text_lower: str) -> Tuple[str, str]:
+    """Return the (category, impact category) of lowercased text from a single keyword scan"""
+    found = _CLASSIFICATION_TABLE.tags(text_lower)
+    category = next((tag for tag in _CATEGORY_KEYWORDS if 'category:' + tag in found), 'general')
+    impact_category = next((tag for tag in _IMPACT_CATEGORY_KEYWORDS if 'impact:' + tag in found), 'other')
+    return category, impact_category
+
+
 class AchievementsExtractor:
     def __init__(self):
         """Initialize the achievements extractor"""
@@ -38,6 +182,18 @@ class AchievementsExtractor:
             r'(?:over|under|within)\s+\d+',  # Time constraints
             r'\d+\+',  # Numbers with plus (indicating "or more")
         ]
+        self._quantifier_res = [re.compile(pattern) for pattern in self.quantifier_patterns]
+
+        # Keyword tables for the configurable headers and indicators; the fixed ones are module level
+        self._header_table = _KeywordTable({'header': self.achievement_headers})
+        # The same header lines ("EXPERIENCE", "SKILLS", ...) recur, so remember their verdicts
+        self._is_header_key = lru_cache(maxsize=2048)(self._header_table.found_in)
+        self._indicator_table = _KeywordTable({'indicator': self.achievement_indicators})
+        # Indicators and positive impact words together, so a statement needs one keyword scan
+        self._statement_table = _KeywordTable({
+            'indicator': self.achievement_indicators,
+            'positive': _POSITIVE_WORDS
+        })
 
         logger.info("🏆 Achievements Extractor initialized")
 
@@ -50,12 +206,20 @@ class AchievementsExtractor:
             experience_data: Parsed experience history
 
         Returns:
-            List of achievement dictionaries
+            List of achievement dictionaries. Every entry has 'description', 'category',
+            'quantified', 'quantified_result', 'metrics', 'source', 'achievement_score'
+            and 'tags'; experience entries add 'impact_level', 'company', 'role' and
+            'period', and general-text entries add 'impact_category'. They stay plain
+            dicts because callers serialise them to JSON and read them by key.
         """
         achievements = []
+        # Split once, then one walk over the lines finds both the achievement sections
+        # and the lines long enough to be general-text candidates
+        lines = resume_text.split('\n')
+        sections, candidate_lines = self._scan_lines(lines)
 
         # Method 1: Extract from dedicated achievement sections
-        dedicated_achievements = self._extract_from_achievement_sections(resume_text)
+        dedicated_achievements = self._extract_from_achievement_sections(resume_text, lines, sections)
         achievements.extend(dedicated_achievements)
 
         # Method 2: Extract from experience descriptions
@@ -64,7 +228,7 @@ class AchievementsExtractor:
             achievements.extend(experience_achievements)
 
         # Method 3: Extract from other sections (education, summary, etc.)
-        general_achievements = self._extract_from_general_text(resume_text)
+        general_achievements = self._extract_from_general_text(resume_text, candidate_lines)
         achievements.extend(general_achievements)
 
         # Remove duplicates and enhance data
@@ -73,37 +237,55 @@ class AchievementsExtractor:
 
         return enhanced_achievements
 
-    def _extract_from_achievement_sections(self, text: str) -> List[Dict]:
+    def _extract_from_achievement_sections(self, text: str, lines: Optional[List[str]] = None,
+                                           achievement_sections: Optional[List[Tuple[int, int]]] = None) -> List[Dict]:
         """Extract achievements from dedicated achievement sections"""
         achievements = []
-        lines = text.split('\n')
+        if lines is None:
+            lines = text.split('\n')
 
         # Find achievement section boundaries
-        achievement_sections = self._find_achievement_sections(lines)
+        if achievement_sections is None:
+            achievement_sections = self._find_achievement_sections(lines)
 
         for section_start, section_end in achievement_sections:
-            section_text = '\n'.join(lines[section_start:section_end])
-            section_achievements = self._parse_achievement_section(section_text)
+            section_achievements = self._parse_achievement_lines(lines[section_start:section_end])
             achievements.extend(section_achievements)
 
         return achievements
 
     def _find_achievement_sections(self, lines: List[str]) -> List[Tuple[int, int]]:
         """Find the boundaries of achievement sections"""
+        return self._scan_lines(lines)[0]
+
+    def _scan_lines(self, lines: List[str]) -> Tuple[List[Tuple[int, int]], List[str]]:
+        """
+        Walk the resume lines once
+
+        Returns:
+            Achievement section boundaries, and the stripped lines longer than 20
+            characters (the candidates for general-text achievements)
+        """
         sections = []
+        candidate_lines = []
         current_section = None
 
         for i, line in enumerate(lines):
-            line_clean = line.strip().lower()
+            stripped = line.strip()
+            if len(stripped) > 20:
+                candidate_lines.append(stripped)
+
+            # Clean each line once for both header checks
+            header_key = self._header_key(line)
 
             # Check if line is an achievement section header
-            if self._is_achievement_header(line_clean):
+            if self._is_header_key(header_key):
                 if current_section is not None:
                     sections.append((current_section, i))
                 current_section = i + 1
 
             # Check if we've hit another major section
-            elif current_section is not None and self._is_major_section_header(line_clean):
+            elif current_section is not None and self._is_major_section_key(header_key):
                 sections.append((current_section, i))
                 current_section = None
 
@@ -111,37 +293,49 @@ class AchievementsExtractor:
         if current_section is not None:
             sections.append((current_section, len(lines)))
 
-        return sections
+        return sections, candidate_lines
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _header_key(line: str) -> str:
+        """Lowercase a line and blank out punctuation, as the header checks expect"""
+        return _PUNCT_RE.sub(' ', line.strip().lower()).strip()
+
+    @staticmethod
+    @lru_cache(maxsize=2048)
+    def _is_major_section_key(header_key: str) -> bool:
+        """Check a cleaned line (see _header_key) for a major section name"""
+        return _MAJOR_SECTION_TABLE.found_in(header_key)
 
     def _is_achievement_header(self, line: str) -> bool:
         """Check if line is an achievement section header"""
-        clean_line = re.sub(r'[^\w\s]', ' ', line).strip()
-        return any(header in clean_line for header in self.achievement_headers)
+        return self._is_header_key(self._header_key(line))
 
     def _is_major_section_header(self, line: str) -> bool:
         """Check if line indicates start of a new major section"""
-        major_sections = {
-            'experience', 'work experience', 'employment', 'employment history',
-            'education', 'skills', 'certifications', 'projects', 'references',
-            'contact', 'summary', 'objective', 'profile'
-        }
-
-        clean_line = re.sub(r'[^\w\s]', ' ', line).strip()
-        return any(section in clean_line for section in major_sections)
+        return self._is_major_section_key(self._header_key(line))
 
     def _parse_achievement_section(self, section_text: str) -> List[Dict]:
         """Parse individual achievement entries from an achievement section"""
+        return self._parse_achievement_lines(section_text.split('\n'))
+
+    def _parse_achievement_lines(self, section_lines: List[str]) -> List[Dict]:
+        """Parse individual achievement entries from the lines of an achievement section"""
         achievements = []
-        lines = [line.strip() for line in section_text.split('\n') if line.strip()]
+        lines = [line.strip() for line in section_lines if line.strip()]
 
         current_achievement = None
+        # Lines of the current achievement's description, joined when it is finished
+        description_parts = []
 
         for line in lines:
             # Check if line starts a new achievement
             if self._looks_like_achievement_start(line):
                 if current_achievement:
+                    current_achievement['description'] = ' '.join(description_parts)
                     achievements.append(current_achievement)
 
+                description_parts = [line]
                 current_achievement = {
                     'description': line,
                     'category': 'achievement',
@@ -152,10 +346,11 @@ class AchievementsExtractor:
                 }
             elif current_achievement:
                 # Continue current achievement description
-                current_achievement['description'] += ' ' + line
+                description_parts.append(line)
 
         # Add final achievement
         if current_achievement:
+            current_achievement['description'] = ' '.join(description_parts)
             achievements.append(current_achievement)
 
         return achievements
@@ -171,16 +366,13 @@ class AchievementsExtractor:
             return False
 
         # Check for bullet points
-        if line.startswith(('•', '-', '*', '◦')) or re.match(r'^\d+\.', line):
+        if line.startswith(_BULLET_MARKERS) or _starts_numbered(line):
             return True
 
-        # Check for achievement indicators
-        has_indicator = any(indicator in line.lower() for indicator in self.achievement_indicators)
-
-        # Check for quantifiers
-        has_quantifier = any(re.search(pattern, line) for pattern in self.quantifier_patterns)
-
-        return has_indicator or has_quantifier
+        # Check for achievement indicators, then (costlier) quantifiers
+        if self._indicator_table.found_in(line.lower()):
+            return True
+        return self._is_quantified(line)
 
     def _extract_from_experience(self, experience_data: List[Dict]) -> List[Dict]:
         """Extract achievements mentioned in experience descriptions"""
@@ -215,14 +407,16 @@ class AchievementsExtractor:
         sentences = self._split_into_statements(description)
 
         for sentence in sentences:
-            if self._is_achievement_statement(sentence):
+            # Lowercase once; every keyword check below reuses it
+            sentence_lower = sentence.lower()
+            if self._is_achievement_statement(sentence, sentence_lower):
                 achievement = {
                     'description': sentence.strip(),
-                    'category': self._categorize_achievement(sentence),
+                    'category': self._categorize_achievement(sentence, sentence_lower),
                     'quantified': self._is_quantified(sentence),
                     'quantified_result': self._extract_quantified_result(sentence),
                     'metrics': self._extract_metrics(sentence),
-                    'impact_level': self._assess_impact_level(sentence)
+                    'impact_level': self._assess_impact_level(sentence, sentence_lower)
                 }
                 achievements.append(achievement)
 
@@ -230,46 +424,42 @@ class AchievementsExtractor:
 
     def _split_into_statements(self, text: str) -> List[str]:
         """Split text into individual statements/sentences"""
+        # Each split needs its marker characters; plain membership tests (memchr-fast)
+        # skip the regex engine for text that contains none of them
+        statements = [text]
+
         # Split by bullet points first
-        bullet_pattern = r'(?:^|\n)\s*[•\-*◦]\s*'
-        statements = re.split(bullet_pattern, text)
+        if any(marker in text for marker in _BULLET_MARKERS):
+            statements = _BULLET_RE.split(text)
 
         # Further split by sentences if no bullet points
-        if len(statements) <= 1:
-            statements = re.split(r'[.!?]+\s+', text)
+        if len(statements) <= 1 and any(mark in text for mark in _SENTENCE_MARKS):
+            statements = _SENTENCE_SPLIT_RE.split(text)
 
         return [stmt.strip() for stmt in statements if stmt.strip()]
 
-    def _is_achievement_statement(self, statement: str) -> bool:
-        """Check if statement describes an achievement"""
-        statement_lower = statement.lower()
-
-        # Check for achievement indicators
-        has_indicator = any(indicator in statement_lower for indicator in self.achievement_indicators)
+    def _is_achievement_statement(self, statement: str, statement_lower: Optional[str] = None) -> bool:
+        """Check if statement describes an achievement (statement_lower: its lowercase form, if known)"""
+        # Must be substantial and have at least one indicator; cheapest checks first
+        if len(statement) <= 20:
+            return False
 
-        # Check for quantifiable results
-        has_quantifier = any(re.search(pattern, statement) for pattern in self.quantifier_patterns)
-
-        # Check for positive impact words
-        positive_words = {
-            'increased', 'improved', 'enhanced', 'optimized', 'streamlined',
-            'reduced', 'decreased', 'minimized', 'eliminated', 'saved',
-            'generated', 'created', 'developed', 'launched', 'delivered',
-            'exceeded', 'surpassed', 'achieved', 'accomplished', 'successful'
-        }
+        if statement_lower is None:
+            statement_lower = statement.lower()
 
-        has_positive_impact = any(word in statement_lower for word in positive_words)
+        # Check for achievement indicators and positive impact words
+        if self._statement_table.found_in(statement_lower):
+            return True
 
-        # Must have at least one indicator and be substantial
-        return (has_indicator or has_quantifier or has_positive_impact) and len(statement) > 20
+        # Check for quantifiable results
+        return self._is_quantified(statement)
 
-    def _extract_from_general_text(self, text: str) -> List[Dict]:
+    def _extract_from_general_text(self, text: str, candidate_lines: Optional[List[str]] = None) -> List[Dict]:
         """Extract achievements from general resume text (summary, etc.)"""
         achievements = []
 
         # Look for achievement patterns in summary/objective sections
-        summary_pattern = r'(?:summary|objective|profile)(?:\s*[:])?\s*([^.]+(?:\.|$))'
-        matches = re.finditer(summary_pattern, text, re.IGNORECASE | re.MULTILINE)
+        matches = _SUMMARY_RE.finditer(text)
 
         for match in matches:
             summary_text = match.group(1)
@@ -285,18 +475,19 @@ class AchievementsExtractor:
                 achievements.append(achievement)
 
         # Enhanced: Parse plain achievement statements that don't follow section patterns
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
-            if len(line) > 20 and self._is_achievement_statement(line):
+        if candidate_lines is None:
+            candidate_lines = self._scan_lines(text.split('\n'))[1]
+        for line in candidate_lines:
+            line_lower = line.lower()
+            if self._is_achievement_statement(line, line_lower):
                 achievement = {
                     'description': line,
-                    'category': self._categorize_achievement(line),
+                    'category': self._categorize_achievement(line, line_lower),
                     'source': 'general_text',
                     'quantified': self._is_quantified(line),
                     'quantified_result': self._extract_quantified_result(line),
                     'metrics': self._extract_metrics(line),
-                    'impact_category': self._assess_impact_level(line)
+                    'impact_category': self._assess_impact_level(line, line_lower)
                 }
                 achievements.append(achievement)
 
@@ -304,33 +495,38 @@ class AchievementsExtractor:
 
     def _is_quantified(self, text: str) -> bool:
         """Check if achievement is quantified with numbers/metrics"""
-        return any(re.search(pattern, text) for pattern in self.quantifier_patterns)
+        # Every quantifier pattern needs a digit or a '$', and most resume lines have neither
+        if not _QUANTIFIER_HINT_RE.search(text):
+            return False
+        return any(pattern.search(text) for pattern in self._quantifier_res)
 
     def _extract_quantified_result(self, text: str) -> str:
         """Extract the specific quantified result from achievement text"""
-        if not self._is_quantified(text):
+        # The extraction scan below doubles as the quantified check, behind the same gate
+        if not _QUANTIFIER_HINT_RE.search(text):
             return ""
 
-        # Extract all quantifiers and return the most significant one
+        # Collect quantifiers in pattern order, stopping once the first two are known
         quantifiers = []
 
-        for pattern in self.quantifier_patterns:
-            matches = re.finditer(pattern, text)
-            for match in matches:
-                quantifiers.append(match.group(0))
+        for pattern in self._quantifier_res:
+            quantifiers += pattern.findall(text)
+            if len(quantifiers) >= 2:
+                break
 
         # Return the first quantifier found, or combine if multiple
-        if quantifiers:
-            return ', '.join(quantifiers[:2])  # Limit to first 2 most important
-
-        return ""
+        return ', '.join(quantifiers[:2])  # Limit to first 2 most important
 
     def _extract_metrics(self, text: str) -> List[Dict]:
         """Extract specific metrics from achievement text"""
         metrics = []
 
+        # Every metric needs a digit or a '$'; skip all three scans when there is neither
+        if not _QUANTIFIER_HINT_RE.search(text):
+            return metrics
+
         # Extract percentages
-        percentage_matches = re.finditer(r'(\d+(?:\.\d+)?)\s*%', text)
+        percentage_matches = _PCT_RE.finditer(text)
         for match in percentage_matches:
             metrics.append({
                 'type': 'percentage',
@@ -340,10 +536,10 @@ class AchievementsExtractor:
             })
 
         # Extract dollar amounts
-        dollar_matches = re.finditer(r'\$\s*([\d,]+(?:\.\d+)?)\s*([kmb]?)', text, re.IGNORECASE)
+        dollar_matches = _DOLLAR_RE.finditer(text)
         for match in dollar_matches:
             value = float(match.group(1).replace(',', ''))
-            multiplier = {'k': 1000, 'm': 1000000, 'b': 1000000000}.get(match.group(2).lower(), 1)
+            multiplier = _CURRENCY_MULTIPLIERS.get(match.group(2).lower(), 1)
             metrics.append({
                 'type': 'currency',
                 'value': value * multiplier,
@@ -352,12 +548,13 @@ class AchievementsExtractor:
             })
 
         # Extract time periods
-        time_matches = re.finditer(r'(\d+)\s*(hours?|days?|weeks?|months?|years?)', text, re.IGNORECASE)
+        time_matches = _TIME_RE.finditer(text)
         for match in time_matches:
             metrics.append({
                 'type': 'time',
                 'value': int(match.group(1)),
-                'unit': match.group(2).lower(),
+                # Interned: only a handful of distinct units recur across every achievement
+                'unit': sys.intern(match.group(2).lower()),
                 'context': self._extract_context(text, match.span())
             })
 
@@ -370,70 +567,70 @@ class AchievementsExtractor:
         context_end = min(len(text), end + 20)
         return text[context_start:context_end].strip()
 
-    def _categorize_achievement(self, text: str) -> str:
+    def _categorize_achievement(self, text: str, text_lower: Optional[str] = None) -> str:
         """Categorize achievement by type"""
-        text_lower = text.lower()
-
-        categories = {
-            'financial': ['revenue', 'profit', 'cost', 'budget', 'savings', 'sales', '$'],
-            'performance': ['efficiency', 'productivity', 'performance', 'speed', 'time'],
-            'quality': ['quality', 'accuracy', 'error', 'defect', 'satisfaction'],
-            'growth': ['growth', 'expansion', 'scale', 'increase', 'users', 'customers'],
-            'leadership': ['led', 'managed', 'directed', 'supervised', 'team'],
-            'innovation': ['created', 'developed', 'designed', 'innovated', 'built'],
-            'recognition': ['award', 'recognition', 'honored', 'winner', 'top']
-        }
+        # Sentences recur across extraction passes, so the shared scan is cached
+        return _classify(text.lower() if text_lower is None else text_lower)[0]
 
-        for category, keywords in categories.items():
-            if any(keyword in text_lower for keyword in keywords):
-                return category
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _impact_level_of(text_lower: str) -> str:
+        """Keyword-based impact level for lowercased text, or '' when no keyword matches"""
+        return _IMPACT_LEVEL_TABLE.first(text_lower, '')
 
-        return 'general'
-
-    def _assess_impact_level(self, text: str) -> str:
+    def _assess_impact_level(self, text: str, text_lower: Optional[str] = None) -> str:
         """Assess the impact level of an achievement"""
-        # High impact indicators
-        high_impact = ['million', 'billion', 'company-wide', 'organization', 'enterprise']
-
-        # Medium impact indicators
-        medium_impact = ['department', 'team', 'division', 'significant', 'major']
-
-        # Low impact indicators
-        low_impact = ['personal', 'individual', 'small', 'minor']
+        # High, then medium, then low impact indicators
+        level = self._impact_level_of(text.lower() if text_lower is None else text_lower)
+        if level:
+            return level
 
-        text_lower = text.lower()
-
-        if any(indicator in text_lower for indicator in high_impact):
-            return 'high'
-        elif any(indicator in text_lower for indicator in medium_impact):
+        # Assess based on quantifiers
+        if self._is_quantified(text):
             return 'medium'
-        elif any(indicator in text_lower for indicator in low_impact):
-            return 'low'
         else:
-            # Assess based on quantifiers
-            if self._is_quantified(text):
-                return 'medium'
-            else:
-                return 'low'
+            return 'low'
 
     def _deduplicate_achievements(self, achievements: List[Dict]) -> List[Dict]:
         """Remove duplicate achievements"""
         unique_achievements = []
-        seen_descriptions = set()
+        # Lowered descriptions already seen, kept or not
+        seen_descriptions: Set[str] = set()
+        # Word sets of kept descriptions, split once each
+        seen_word_sets: List[FrozenSet[str]] = []
+        # Word -> indexes of kept descriptions containing it. Descriptions sharing no
+        # word have zero similarity, so only these buckets need comparing
+        seen_by_word: Dict[str, List[int]] = {}
 
         for achievement in achievements:
             description = achievement.get('description', '').lower().strip()
+            # The same bullet often appears in several sections; drop repeats with a
+            # set lookup before any word-set comparison
+            if description in seen_descriptions:
+                continue
+            # Empty descriptions share no words with anything, so they are all kept
+            if description:
+                seen_descriptions.add(description)
+            words = frozenset(description.split())
 
-            # Simple deduplication based on description similarity
+            # Simple deduplication based on description similarity (word-set Jaccard)
             is_duplicate = False
-            for seen in seen_descriptions:
-                if self._calculate_similarity(description, seen) > 0.8:
+            candidates = {index for word in words for index in seen_by_word.get(word, ())}
+            for index in candidates:
+                seen = seen_word_sets[index]
+                # Jaccard is at most the size ratio, so a ratio of 0.8 or less can't exceed 0.8
+                if min(len(words), len(seen)) * 5 <= max(len(words), len(seen)) * 4:
+                    continue
+                shared = len(words & seen)
+                if shared / (len(words) + len(seen) - shared) > 0.8:
                     is_duplicate = True
                     break
 
             if not is_duplicate:
                 unique_achievements.append(achievement)
-                seen_descriptions.add(description)
+                for word in words:
+                    seen_by_word.setdefault(word, []).append(len(seen_word_sets))
+                seen_word_sets.append(words)
 
         return unique_achievements
 
@@ -474,13 +671,11 @@ class AchievementsExtractor:
 
         # Add points for impact level
         impact_level = achievement.get('impact_level', 'low')
-        impact_scores = {'high': 4, 'medium': 2, 'low': 1}
-        score += impact_scores.get(impact_level, 1)
+        score += _IMPACT_SCORES.get(impact_level, 1)
 
         # Add points for category
         category = achievement.get('category', 'general')
-        high_value_categories = {'financial', 'leadership', 'innovation'}
-        if category in high_value_categories:
+        if category in _HIGH_VALUE_CATEGORIES:
             score += 2
 
         # Add points for metrics
@@ -491,25 +686,8 @@ class AchievementsExtractor:
 
     def _extract_achievement_tags(self, description: str) -> List[str]:
         """Extract relevant tags from achievement description"""
-        tags = []
-        description_lower = description.lower()
-
-        tag_keywords = {
-            'leadership': ['led', 'managed', 'directed', 'supervised'],
-            'teamwork': ['team', 'collaboration', 'coordinated'],
-            'innovation': ['created', 'developed', 'designed', 'built'],
-            'efficiency': ['improved', 'optimized', 'streamlined'],
-            'growth': ['increased', 'grew', 'expanded', 'scaled'],
-            'cost_savings': ['reduced', 'saved', 'cut', 'minimized'],
-            'quality': ['quality', 'accuracy', 'excellence'],
-            'customer_focus': ['customer', 'client', 'satisfaction']
-        }
-
-        for tag, keywords in tag_keywords.items():
-            if any(keyword in description_lower for keyword in keywords):
-                tags.append(tag)
-
-        return tags
+        found = _TAG_TABLE.tags(description.lower())
+        return [tag for tag in _TAG_TABLE.order if tag in found]
 
 # Example usage and testing
 if __name__ == "__main__":
@@ -596,29 +774,5 @@ if __name__ == "__main__":
         """Determine the impact category for an achievement"""
         description = achievement.get('description', '').lower()
 
-        # Financial impact indicators
-        if any(word in description for word in ['revenue', 'profit', 'cost', 'sales', 'budget', '$', 'roi', 'savings']):
-            return 'financial'
-
-        # Operational impact indicators
-        elif any(word in description for word in ['efficiency', 'process', 'time', 'reduced', 'optimized', 'automated']):
-            return 'operational'
-
-        # Leadership impact indicators
-        elif any(word in description for word in ['led', 'managed', 'team', 'people', 'mentor', 'trained']):
-            return 'leadership'
-
-        # Innovation impact indicators
-        elif any(word in description for word in ['new', 'innovative', 'created', 'developed', 'designed', 'patent']):
-            return 'innovation'
-
-        # Customer impact indicators
-        elif any(word in description for word in ['customer', 'client', 'user', 'satisfaction', 'experience', 'service']):
-            return 'customer'
-
-        # Quality impact indicators
-        elif any(word in description for word in ['quality', 'accuracy', 'reliability', 'testing', 'bugs', 'defects']):
-            return 'quality'
-
-        else:
-            return 'other'
\ No newline at end of file
+        # Financial, operational, leadership, innovation, customer, then quality indicators
+        return _classify(description)[1]
\ No newline at end of file
@@ -6,13 +6,64 @@ Implements all fields and requirements from Arytic Resume Parser BRD
 
 import re
 import json
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 import time
 from typing import Dict, List, Any, Optional, Tuple
 import phonenumbers
-from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
 
+# Patterns used on every parse, compiled once at import
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b')
+# Tried in order. A bare run of ten digits also matches the first pattern, so a separate
+# ten-digit pattern could never be reached and is not listed; the second only adds
+# '(555)   123-4567' style numbers with several spaces after the area code
+_PHONE_RES = [re.compile(pattern) for pattern in (
+    r'(\+\d{1,3}[-.\s]?)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})',
+    r'(\+\d{1,3}[-.\s]?)?\((\d{3})\)\s*(\d{3})[-.\s]?(\d{4})'
+)]
+_NAME_RES = [re.compile(pattern) for pattern in (
+    r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]*\.?\s*)*[A-Z][a-z]+)$',
+    r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*$'
+)]
+# Text that rules a header line out as the candidate's name
+_NAME_STOP_WORDS = ('resume', 'cv', 'curriculum', 'phone', 'email', '@')
+_JOB_TITLE_RES = [re.compile(pattern) for pattern in (
+    r'(?:^|\n)([A-Z][a-zA-Z\s&,-]+(?:Engineer|Developer|Manager|Analyst|Specialist|Consultant|Director|Lead|Senior|Junior))',
+    r'(?:^|\n)([A-Z][a-zA-Z\s&,-]+)\s*(?:\||@|at|,|\n)'
+)]
+_DATE_RES = [re.compile(pattern) for pattern in (
+    r'\d{4}', r'\d{1,2}/\d{4}', r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec'
+)]
+# Parts of an experience string such as '3 years 2 months'
+_YEARS_RE = re.compile(r'(\d+)\s*years?')
+_MONTHS_RE = re.compile(r'(\d+)\s*months?')
+
+# Keywords locating each section; a section starts at the first line containing any of them
+_SECTION_KEYWORDS = {
+    'summary': ['summary', 'objective', 'profile', 'overview', 'about', 'qualification summary'],
+    'experience': ['experience', 'work history', 'employment', 'professional experience'],
+    'skills': ['skills', 'technical skills', 'core competencies', 'technologies'],
+    'education': ['education', 'academic', 'qualification', 'degree'],
+    'certifications': ['certification', 'certificate', 'licensed', 'credentials'],
+    'languages': ['languages', 'language'],
+    'achievements': ['achievements', 'accomplishments', 'awards', 'honors'],
+    'projects': ['projects', 'project', 'key projects'],
+}
+
+# Substrings marking a line as a section header, job title or company (with word limits for the first two)
+_SECTION_HEADER_KEYWORDS = ('experience', 'education', 'skills', 'projects', 'certifications', 'languages',
+                            'achievements', 'summary', 'objective')
+_JOB_TITLE_INDICATORS = ('engineer', 'developer', 'manager', 'analyst', 'specialist', 'consultant', 'director',
+                         'lead', 'senior', 'junior')
+_COMPANY_INDICATORS = ('inc', 'llc', 'corp', 'ltd', 'company', 'technologies', 'systems', 'solutions')
+
+# Top-level result fields, in output order (ParsingMetadata is always added)
+_EXTRACTED_FIELDS = ("PersonalDetails", "OverallSummary", "ListOfExperiences", "ListOfSkills", "Education",
+                     "Certifications", "Languages", "Achievements", "Projects")
+
+
 class BRDCompliantResumeParser:
     """
     Resume Parser that fully complies with Arytic BRD requirements
@@ -23,6 +74,7 @@ class BRDCompliantResumeParser:
         self.skill_synonyms = self._load_skill_synonyms()
         self.job_title_synonyms = self._load_job_title_synonyms()
         self.countries = self._load_country_codes()
+        self._skill_index = self._build_synonym_index(self.skill_synonyms)
 
     def _load_skill_synonyms(self) -> Dict[str, List[str]]:
         """Load skill synonym mappings"""
@@ -46,6 +98,15 @@ class BRDCompliantResumeParser:
             'machine_learning': ['machine learning', 'ml', 'artificial intelligence', 'ai', 'deep learning', 'neural networks']
         }
 
+    @staticmethod
+    def _build_synonym_index(synonym_map: Dict[str, List[str]]) -> Dict[str, Tuple[str, List[str]]]:
+        """Map each lowercased synonym to its (category, synonyms); the first category listing it wins"""
+        index = {}
+        for category, synonyms in synonym_map.items():
+            for synonym in synonyms:
+                index.setdefault(synonym.lower(), (category, synonyms))
+        return index
+
     def _load_job_title_synonyms(self) -> Dict[str, List[str]]:
         """Load job title synonym mappings"""
         return {
@@ -78,35 +139,47 @@ class BRDCompliantResumeParser:
             'netherlands': '+31', 'nl': '+31'
         }
 
-    def parse_resume_brd_compliant(self, text_content: str, filename: str = "") -> Dict[str, Any]:
+    def parse_resume_brd_compliant(self, text_content: str, filename: str = "",
+                                   fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         Parse resume according to BRD requirements
-        Returns structured data matching all BRD-specified fields
+        Returns structured data matching all BRD-specified fields, or only the top-level
+        fields listed in `fields` (e.g. ["PersonalDetails"]) plus ParsingMetadata
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+
+        if fields is None:
+            fields = list(_EXTRACTED_FIELDS)
+        else:
+            unknown = [name for name in fields if name not in _EXTRACTED_FIELDS]
+            if unknown:
+                raise ValueError(f"Unknown resume fields: {unknown}")
 
         # Clean and process text
         lines = [line.strip() for line in text_content.split('\n') if line.strip()]
-        clean_text = ' '.join(lines)
-
-        result = {
-            "PersonalDetails": self._extract_personal_details(lines, clean_text),
-            "OverallSummary": self._extract_overall_summary(lines, clean_text),
-            "ListOfExperiences": self._extract_experiences(lines, clean_text),
-            "ListOfSkills": self._extract_skills_brd(lines, clean_text),
-            "Education": self._extract_education_brd(lines, clean_text),
-            "Certifications": self._extract_certifications_brd(lines, clean_text),
-            "Languages": self._extract_languages_brd(lines, clean_text),
-            "Achievements": self._extract_achievements_brd(lines, clean_text),
-            "Projects": self._extract_projects_brd(lines, clean_text),
-            "ParsingMetadata": {
-                "parsing_time_ms": round((time.time() - start_time) * 1000, 2),
-                "timestamp": datetime.now().isoformat(),
-                "parser_version": "BRD-Compliant-v1.0",
-                "source_file": filename,
-                "brd_compliant": True,
-                "total_fields_extracted": 0  # Will be calculated
-            }
+        # Locate every section in one walk over the lines, unless only personal details are wanted
+        sections = self._find_sections(lines) if any(name != "PersonalDetails" for name in fields) else {}
+
+        extractors = {
+            "PersonalDetails": lambda: self._extract_personal_details(lines),
+            "OverallSummary": lambda: self._extract_overall_summary(lines, sections),
+            "ListOfExperiences": lambda: self._extract_experiences(lines, sections),
+            "ListOfSkills": lambda: self._extract_skills_brd(lines, sections),
+            "Education": lambda: self._extract_education_brd(lines, sections),
+            "Certifications": lambda: self._extract_certifications_brd(lines, sections),
+            "Languages": lambda: self._extract_languages_brd(lines, sections),
+            "Achievements": lambda: self._extract_achievements_brd(lines, sections),
+            "Projects": lambda: self._extract_projects_brd(lines, sections),
+        }
+        # Run only the requested extractors, keeping the usual key order
+        result = {name: extractors[name]() for name in _EXTRACTED_FIELDS if name in fields}
+        result["ParsingMetadata"] = {
+            "parsing_time_ms": round((time.perf_counter_ns() - start_ns) / 1e6, 2),
+            "timestamp": datetime.now().isoformat(),
+            "parser_version": "BRD-Compliant-v1.0",
+            "source_file": filename,
+            "brd_compliant": True,
+            "total_fields_extracted": 0  # Will be calculated
         }
 
         # Calculate total fields extracted for accuracy measurement
@@ -114,12 +187,29 @@ class BRDCompliantResumeParser:
 
         return result
 
-    def _extract_personal_details(self, lines: List[str], text: str) -> Dict[str, Any]:
+    def parse_batch(self, docs: List[Tuple[str, str]], workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Parse several resumes, given as (text_content, filename) pairs
+        Resumes are spread over `workers` processes (default: one per CPU); workers=1 parses in-process
+        Returns one BRD result per resume, in input order
+        """
+        # Each resume is searched on its own: the email/phone searches stop at the first
+        # match, which beats one finditer over all resumes joined together
+        if workers == 1 or len(docs) < 2:
+            return [self.parse_resume_brd_compliant(text_content, filename) for text_content, filename in docs]
+
+        # Parsing is CPU-bound Python, so use processes; each worker receives this parser once
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as executor:
+            return list(executor.map(_parse_in_worker, docs, chunksize=16))
+
+    def _extract_personal_details(self, lines: List[str]) -> Dict[str, Any]:
         """Extract personal details according to BRD requirements"""
         personal_details = {}
+        # Email and phone are searched in the lines joined into one string (a phone number may wrap)
+        text = ' '.join(lines)
 
         # Extract full name and components
-        name_info = self._extract_name_components(lines, text)
+        name_info = self._extract_name_components(lines)
         personal_details.update(name_info)
 
         # Extract email
@@ -133,12 +223,12 @@ class BRDCompliantResumeParser:
 
         return personal_details
 
-    def _extract_name_components(self, lines: List[str], text: str) -> Dict[str, str]:
+    def _extract_name_components(self, lines: List[str]) -> Dict[str, str]:
         """Extract Full Name, First Name, Middle Name, Last Name"""
         name_info = {}
 
         # Try multiple strategies to find name
-        full_name = self._find_candidate_name(lines, text)
+        full_name = self._find_candidate_name(lines)
 
         if full_name:
             name_info["FullName"] = full_name
@@ -161,23 +251,21 @@ class BRDCompliantResumeParser:
 
         return name_info
 
-    def _find_candidate_name(self, lines: List[str], text: str) -> str:
+    def _find_candidate_name(self, lines: List[str]) -> str:
         """Find candidate name using multiple strategies"""
         # Strategy 1: First non-empty line that looks like a name
         for line in lines[:5]:
-            if len(line.split()) <= 4 and all(word.replace('.', '').replace(',', '').isalpha() or word.isupper() for word in line.split()):
-                if not any(keyword in line.lower() for keyword in ['resume', 'cv', 'curriculum', 'phone', 'email', '@']):
+            # Split once, into at most 5 pieces: more than 4 words rules the line out anyway
+            words = line.split(None, 4)
+            if len(words) <= 4 and all(word.replace('.', '').replace(',', '').isalpha() or word.isupper() for word in words):
+                line_lower = line.lower()
+                if not any(keyword in line_lower for keyword in _NAME_STOP_WORDS):
                     return line.strip()
 
         # Strategy 2: Look for name patterns
-        name_patterns = [
-            r'^([A-Z][a-z]+(?:\s+[A-Z][a-z]*\.?\s*)*[A-Z][a-z]+)$',
-            r'([A-Z][a-z]+\s+[A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)\s*$'
-        ]
-
         for line in lines[:5]:
-            for pattern in name_patterns:
-                match = re.search(pattern, line.strip())
+            for pattern in _NAME_RES:
+                match = pattern.search(line.strip())
                 if match:
                     return match.group(1).strip()
 
@@ -185,25 +273,18 @@ class BRDCompliantResumeParser:
 
     def _extract_email(self, text: str) -> str:
         """Extract email address"""
-        email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        matches = re.findall(email_pattern, text)
-        return matches[0] if matches else ""
+        match = _EMAIL_RE.search(text)
+        return match.group(0) if match else ""
 
     def _extract_phone_with_country_code(self, text: str) -> Dict[str, str]:
         """Extract phone number and country code"""
         phone_info = {}
 
-        # Phone patterns
-        phone_patterns = [
-            r'(\+\d{1,3}[-.\s]?)?\(?(\d{3})\)?[-.\s]?(\d{3})[-.\s]?(\d{4})',
-            r'(\+\d{1,3}[-.\s]?)?(\d{10})',
-            r'(\+\d{1,3}[-.\s]?)?\((\d{3})\)\s*(\d{3})[-.\s]?(\d{4})'
-        ]
-
-        for pattern in phone_patterns:
-            matches = re.findall(pattern, text)
-            if matches:
-                match = matches[0]
+        for pattern in _PHONE_RES:
+            # Only the first match is used, so stop scanning there
+            found = pattern.search(text)
+            if found:
+                match = found.groups('')
                 if isinstance(match, tuple):
                     # Extract country code and phone
                     if match[0]:  # Has country code
@@ -212,70 +293,65 @@ class BRDCompliantResumeParser:
                             country_code = '+' + country_code
                         phone_info["CountryCode"] = country_code
 
-                        # Format phone number
-                        phone_digits = ''.join(filter(str.isdigit, ''.join(match[1:])))
+                        # Format phone number; the groups after the country code hold only digits
+                        phone_digits = ''.join(match[1:])
                         if len(phone_digits) == 10:
                             phone_info["PhoneNumber"] = f"({phone_digits[:3]}) {phone_digits[3:6]}-{phone_digits[6:]}"
                     else:
                         # No country code, assume US
                         phone_info["CountryCode"] = "+1"
-                        phone_digits = ''.join(filter(str.isdigit, ''.join(match)))
+                        phone_digits = ''.join(match)
                         if len(phone_digits) == 10:
                             phone_info["PhoneNumber"] = f"({phone_digits[:3]}) {phone_digits[3:6]}-{phone_digits[6:]}"
                 break
 
         return phone_info
 
-    def _extract_overall_summary(self, lines: List[str], text: str) -> Dict[str, Any]:
+    def _extract_overall_summary(self, lines: List[str], sections: Dict[str, List[str]]) -> Dict[str, Any]:
         """Extract overall summary information"""
         summary_info = {}
 
         # Extract current job role (from most recent experience)
-        current_role = self._extract_current_job_role(lines, text)
+        current_role = self._extract_current_job_role(lines, sections)
         if current_role:
             summary_info["CurrentJobRole"] = current_role
 
         # Extract relevant job titles with synonyms
-        job_titles = self._extract_relevant_job_titles(lines, text)
+        job_titles = self._extract_relevant_job_titles(lines)
         summary_info["RelevantJobTitles"] = job_titles
 
         # Extract total experience
-        total_exp = self._calculate_total_experience(lines, text)
+        total_exp = self._calculate_total_experience(lines)
         if total_exp:
             summary_info["TotalExperience"] = total_exp
 
         # Extract overall summary text
-        summary_text = self._extract_summary_text(lines, text)
+        summary_text = self._extract_summary_text(lines, sections)
         if summary_text:
             summary_info["OverallSummary"] = summary_text
 
         return summary_info
 
-    def _extract_current_job_role(self, lines: List[str], text: str) -> str:
+    def _extract_current_job_role(self, lines: List[str], sections: Dict[str, List[str]]) -> str:
         """Extract current job role from most recent experience"""
         # Look for job titles in experience section
-        experience_section = self._find_section(lines, ['experience', 'work history', 'employment', 'professional experience'])
+        experience_section = sections['experience']
 
         if experience_section:
             # Find first job title after experience header
-            job_title_patterns = [
-                r'(?:^|\n)([A-Z][a-zA-Z\s&,-]+(?:Engineer|Developer|Manager|Analyst|Specialist|Consultant|Director|Lead|Senior|Junior))',
-                r'(?:^|\n)([A-Z][a-zA-Z\s&,-]+)\s*(?:\||@|at|,|\n)'
-            ]
-
-            for pattern in job_title_patterns:
-                matches = re.findall(pattern, ' '.join(experience_section[:10]))
+            for pattern in _JOB_TITLE_RES:
+                matches = pattern.findall(' '.join(experience_section[1:11]))
                 if matches:
                     return matches[0].strip()
 
         return ""
 
-    def _extract_relevant_job_titles(self, lines: List[str], text: str) -> List[Dict[str, Any]]:
+    def _extract_relevant_job_titles(self, lines: List[str]) -> List[Dict[str, Any]]:
         """Extract job titles with synonym matching"""
         job_titles = []
 
         # Extract all job titles from text
-        found_titles = self._find_all_job_titles(lines, text)
+        found_titles = self._find_all_job_titles(lines)
 
         for title in found_titles:
             # Find synonyms and calculate matching percentage
@@ -289,10 +365,10 @@ class BRDCompliantResumeParser:
 
         return job_titles
 
-    def _calculate_total_experience(self, lines: List[str], text: str) -> str:
+    def _calculate_total_experience(self, lines: List[str]) -> str:
         """Calculate total work experience"""
         # Extract all date ranges from experience section
-        date_ranges = self._extract_experience_dates(lines, text)
+        date_ranges = self._extract_experience_dates(lines)
 
         if not date_ranges:
             return ""
@@ -316,11 +392,9 @@ class BRDCompliantResumeParser:
 
         return ""
 
-    def _extract_summary_text(self, lines: List[str], text: str) -> str:
+    def _extract_summary_text(self, lines: List[str], sections: Dict[str, List[str]]) -> str:
         """Extract overall summary/qualification summary"""
-        summary_keywords = ['summary', 'objective', 'profile', 'overview', 'about', 'qualification summary']
-
-        summary_section = self._find_section(lines, summary_keywords)
+        summary_section = sections['summary']
 
         if summary_section and len(summary_section) > 1:
             # Return first few lines of summary, excluding the header
@@ -329,16 +403,18 @@ class BRDCompliantResumeParser:
 
         # Fallback: look for paragraph that seems like a summary
         for i, line in enumerate(lines[:10]):
-            if len(line.split()) > 15 and any(keyword in line.lower() for keyword in ['experience', 'skilled', 'professional', 'expertise']):
-                return line.strip()
+            if len(line.split()) > 15:
+                line_lower = line.lower()
+                if any(keyword in line_lower for keyword in ['experience', 'skilled', 'professional', 'expertise']):
+                    return line.strip()
 
         return ""
 
-    def _extract_experiences(self, lines: List[str], text: str) -> List[Dict[str, Any]]:
+    def _extract_experiences(self, lines: List[str], sections: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """Extract work experience details"""
         experiences = []
 
-        experience_section = self._find_section(lines, ['experience', 'work history', 'employment', 'professional experience'])
+        experience_section = sections['experience']
 
         if not experience_section:
             return experiences
@@ -348,7 +424,9 @@ class BRDCompliantResumeParser:
         in_experience = False
 
         for line in experience_section:
-            if self._is_job_title_line(line):
+            # The line predicates all work on the lowercased line
+            line_lower = line.lower()
+            if self._is_job_title_line(line_lower):
                 # Save previous experience if exists
                 if current_exp and 'JobTitle' in current_exp:
                     experiences.append(current_exp)
@@ -357,11 +435,11 @@ class BRDCompliantResumeParser:
                 current_exp = {"JobTitle": line.strip()}
                 in_experience = True
 
-            elif self._is_company_line(line) and in_experience:
+            elif self._is_company_line(line_lower) and in_experience:
                 current_exp["CompanyName"] = self._extract_company_name(line)
                 current_exp["Location"] = self._extract_location_from_line(line)
 
-            elif self._is_date_line(line) and in_experience:
+            elif self._is_date_line(line_lower) and in_experience:
                 date_info = self._parse_experience_dates(line)
                 current_exp.update(date_info)
 
@@ -383,42 +461,33 @@ class BRDCompliantResumeParser:
 
         return experiences
 
-    def _extract_skills_brd(self, lines: List[str], text: str) -> List[Dict[str, Any]]:
+    def _extract_skills_brd(self, lines: List[str], sections: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """Extract skills according to BRD requirements"""
-        skills = []
-
-        # Find skills section
-        skills_section = self._find_section(lines, ['skills', 'technical skills', 'core competencies', 'technologies'])
-
-        # Extract skills from section
-        found_skills = set()
-
-        if skills_section:
-            for line in skills_section[1:]:  # Skip header
-                line_skills = self._extract_skills_from_line(line)
-                found_skills.update(line_skills)
+        # Extract skills from the skills section, skipping its header
+        found_skills = {skill for line in sections['skills'][1:] for skill in self._extract_skills_from_line(line)}
 
         # Also extract skills from experience descriptions
-        experience_skills = self._extract_skills_from_experience(lines, text)
-        found_skills.update(experience_skills)
+        found_skills.update(self._extract_skills_from_experience(lines))
 
         # Process each skill with synonyms and experience calculation
-        for skill in found_skills:
-            skill_info = {
+        skills = [
+            {
                 "SkillsName": skill,
-                "SkillExperience": self._calculate_skill_experience(skill, lines, text),
-                "LastUsed": self._get_skill_last_used(skill, lines, text),
+                "SkillExperience": self._calculate_skill_experience(skill, lines),
+                "LastUsed": self._get_skill_last_used(skill, lines),
                 "RelevantSkills": self._find_skill_synonyms(skill)
             }
-            skills.append(skill_info)
+            for skill in found_skills
+        ]
 
-        return sorted(skills, key=lambda x: x.get('SkillExperience', ''), reverse=True)
+        # Longest experience first, compared as a number of months rather than as text
+        return sorted(skills, key=lambda x: self._experience_in_months(x.get('SkillExperience', '')), reverse=True)
 
-    def _extract_education_brd(self, lines: List[str], text: str) -> List[Dict[str, Any]]:
+    def _extract_education_brd(self, lines: List[str], sections: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """Extract education details according to BRD"""
         education_entries = []
 
-        education_section = self._find_section(lines, ['education', 'academic', 'qualification', 'degree'])
+        education_section = sections['education']
 
         if not education_section:
             return education_entries
@@ -449,11 +518,11 @@ class BRDCompliantResumeParser:
 
         return education_entries
 
-    def _extract_certifications_brd(self, lines: List[str], text: str) -> List[Dict[str, Any]]:
+    def _extract_certifications_brd(self, lines: List[str], sections: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """Extract certifications according to BRD"""
         certifications = []
 
-        cert_section = self._find_section(lines, ['certification', 'certificate', 'licensed', 'credentials'])
+        cert_section = sections['certifications']
 
         if cert_section:
             for line in cert_section[1:]:  # Skip header
@@ -463,11 +532,11 @@ class BRDCompliantResumeParser:
 
         return certifications
 
-    def _extract_languages_brd(self, lines: List[str], text: str) -> List[Dict[str, str]]:
+    def _extract_languages_brd(self, lines: List[str], sections: Dict[str, List[str]]) -> List[Dict[str, str]]:
         """Extract languages according to BRD"""
         languages = []
 
-        lang_section = self._find_section(lines, ['languages', 'language'])
+        lang_section = sections['languages']
 
         if lang_section:
             for line in lang_section[1:]:  # Skip header
@@ -477,11 +546,11 @@ class BRDCompliantResumeParser:
 
         return languages
 
-    def _extract_achievements_brd(self, lines: List[str], text: str) -> List[str]:
+    def _extract_achievements_brd(self, lines: List[str], sections: Dict[str, List[str]]) -> List[str]:
         """Extract achievements according to BRD"""
         achievements = []
 
-        achieve_section = self._find_section(lines, ['achievements', 'accomplishments', 'awards', 'honors'])
+        achieve_section = sections['achievements']
 
         if achieve_section:
             for line in achieve_section[1:]:  # Skip header
@@ -490,16 +559,16 @@ class BRDCompliantResumeParser:
 
         return achievements
 
-    def _extract_projects_brd(self, lines: List[str], text: str) -> List[Dict[str, Any]]:
+    def _extract_projects_brd(self, lines: List[str], sections: Dict[str, List[str]]) -> List[Dict[str, Any]]:
         """Extract projects according to BRD requirements"""
         projects = []
 
         # Find projects section
-        project_section = self._find_section(lines, ['projects', 'project', 'key projects'])
+        project_section = sections['projects']
 
         if not project_section:
             # Look for projects in experience descriptions
-            return self._extract_projects_from_experience(lines, text)
+            return self._extract_projects_from_experience(lines)
 
         current_project = {}
 
@@ -520,7 +589,7 @@ class BRDCompliantResumeParser:
                     current_project["Description"] += " " + line.strip()
 
             # Extract other project details
-            if self._is_date_line(line) and current_project:
+            if self._is_date_line(line.lower()) and current_project:
                 date_info = self._parse_project_dates(line)
                 current_project.update(date_info)
 
@@ -531,60 +600,82 @@ class BRDCompliantResumeParser:
         return projects
 
     # Helper methods for finding sections, parsing dates, etc.
-    def _find_section(self, lines: List[str], keywords: List[str]) -> List[str]:
-        """Find section in resume by keywords"""
-        for i, line in enumerate(lines):
-            if any(keyword.lower() in line.lower() for keyword in keywords):
-                # Found section header, return lines until next section
-                section_lines = [line]
-                for j in range(i + 1, len(lines)):
-                    next_line = lines[j]
-                    # Stop if we hit another section header
-                    if self._is_section_header(next_line) and j > i + 3:
-                        break
-                    section_lines.append(next_line)
-                return section_lines
-        return []
+    def _find_sections(self, lines: List[str]) -> Dict[str, List[str]]:
+        """
+        Find every section in resume by keywords, in one pass over the lines
+        Each section runs from its first header-like line (at most four words) containing a
+        keyword until the next section header more than three lines further down (or the end);
+        missing sections are []
+        """
+        starts = {}
+        header_indexes = []
+        # Sections whose start is still unknown, and all of their keywords for a quick first test
+        pending = dict(_SECTION_KEYWORDS)
+        pending_keywords = [keyword for keywords in pending.values() for keyword in keywords]
 
-    def _is_section_header(self, line: str) -> bool:
-        """Check if line is a section header"""
-        section_keywords = ['experience', 'education', 'skills', 'projects', 'certifications', 'languages', 'achievements', 'summary', 'objective']
-        return any(keyword.lower() in line.lower() for keyword in section_keywords) and len(line.split()) <= 3
+        for i, line in enumerate(lines):
+            line_lower = line.lower()
+            # Only short lines can open a section; prose such as 'I have experience in Python' can't
+            if (pending_keywords and len(line_lower.split(None, 4)) <= 4
+                    and any(keyword in line_lower for keyword in pending_keywords)):
+                for name, keywords in list(pending.items()):
+                    if any(keyword in line_lower for keyword in keywords):
+                        starts[name] = i
+                        del pending[name]
+                pending_keywords = [keyword for keywords in pending.values() for keyword in keywords]
+            # Headers only matter as the end of a section, so none are needed before the first start
+            if starts and self._is_section_header(line_lower):
+                header_indexes.append(i)
+
+        # Each section ends at the first header past the three lines after its start
+        section_bounds = {}
+        for name, i in starts.items():
+            k = bisect_right(header_indexes, i + 3)
+            section_bounds[name] = (i, header_indexes[k] if k < len(header_indexes) else len(lines))
+
+        sections = {}
+        for name in _SECTION_KEYWORDS:
+            start, end = section_bounds.get(name, (0, 0))
+            sections[name] = lines[start:end]
+        return sections
+
+    def _is_section_header(self, line_lower: str) -> bool:
+        """Check if (lowercased) line is a section header"""
+        # Word count first: it rejects most lines, and at most 4 pieces are needed to tell
+        return len(line_lower.split(None, 3)) <= 3 and any(keyword in line_lower for keyword in _SECTION_HEADER_KEYWORDS)
 
     def _count_extracted_fields(self, result: Dict[str, Any]) -> int:
         """Count how many fields were successfully extracted"""
         count = 0
+        # Walk nested dicts and lists with an explicit stack; only non-empty dict values count
+        stack = [result]
 
-        def count_fields(obj):
-            nonlocal count
+        while stack:
+            obj = stack.pop()
             if isinstance(obj, dict):
-                for key, value in obj.items():
-                    if value and value != "" and value != [] and value != {}:
+                for value in obj.values():
+                    if value:
                         count += 1
                         if isinstance(value, (dict, list)):
-                            count_fields(value)
+                            stack.append(value)
             elif isinstance(obj, list):
-                for item in obj:
-                    count_fields(item)
+                stack.extend(obj)
 
-        count_fields(result)
         return count
 
     # Placeholder methods for complex parsing logic
-    def _is_job_title_line(self, line: str) -> bool:
-        """Check if line contains a job title"""
-        job_indicators = ['engineer', 'developer', 'manager', 'analyst', 'specialist', 'consultant', 'director', 'lead', 'senior', 'junior']
-        return any(indicator in line.lower() for indicator in job_indicators) and len(line.split()) <= 6
+    def _is_job_title_line(self, line_lower: str) -> bool:
+        """Check if (lowercased) line contains a job title"""
+        return len(line_lower.split(None, 6)) <= 6 and any(indicator in line_lower for indicator in _JOB_TITLE_INDICATORS)
 
-    def _is_company_line(self, line: str) -> bool:
-        """Check if line contains company information"""
-        company_indicators = ['inc', 'llc', 'corp', 'ltd', 'company', 'technologies', 'systems', 'solutions']
-        return any(indicator in line.lower() for indicator in company_indicators)
+    def _is_company_line(self, line_lower: str) -> bool:
+        """Check if (lowercased) line contains company information"""
+        # Like job titles, company lines are short; a bullet mentioning 'solutions' is not one
+        return len(line_lower.split(None, 6)) <= 6 and any(indicator in line_lower for indicator in _COMPANY_INDICATORS)
 
-    def _is_date_line(self, line: str) -> bool:
-        """Check if line contains dates"""
-        date_patterns = [r'\d{4}', r'\d{1,2}/\d{4}', r'jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec']
-        return any(re.search(pattern, line.lower()) for pattern in date_patterns)
+    def _is_date_line(self, line_lower: str) -> bool:
+        """Check if (lowercased) line contains dates"""
+        return any(pattern.search(line_lower) for pattern in _DATE_RES)
 
     def _parse_experience_dates(self, line: str) -> Dict[str, str]:
         """Parse start and end dates from experience line"""
@@ -596,6 +687,13 @@ class BRDCompliantResumeParser:
         # Implementation for duration calculation
         return ""
 
+    @staticmethod
+    def _experience_in_months(experience: str) -> int:
+        """Convert an experience string such as '3 years 2 months' to months (0 if empty)"""
+        years = _YEARS_RE.search(experience)
+        months = _MONTHS_RE.search(experience)
+        return (int(years.group(1)) * 12 if years else 0) + (int(months.group(1)) if months else 0)
+
     def _extract_skills_from_line(self, line: str) -> List[str]:
         """Extract skills from a line"""
         # Implementation for skill extraction
@@ -603,15 +701,14 @@ class BRDCompliantResumeParser:
 
     def _find_skill_synonyms(self, skill: str) -> Dict[str, Any]:
         """Find synonyms for a skill"""
-        skill_lower = skill.lower()
-
-        for category, synonyms in self.skill_synonyms.items():
-            if skill_lower in [s.lower() for s in synonyms]:
-                return {
-                    "synonyms": synonyms,
-                    "category": category,
-                    "match_percentage": 100
-                }
+        hit = self._skill_index.get(skill.lower())
+        if hit:
+            category, synonyms = hit
+            return {
+                "synonyms": synonyms,
+                "category": category,
+                "match_percentage": 100
+            }
 
         return {"synonyms": [skill], "category": "other", "match_percentage": 100}
 
@@ -622,11 +719,11 @@ class BRDCompliantResumeParser:
         """Find synonyms for job title"""
         return {"synonyms": [title], "category": "other", "match_percentage": 100}
 
-    def _find_all_job_titles(self, lines: List[str], text: str) -> List[str]:
+    def _find_all_job_titles(self, lines: List[str]) -> List[str]:
         """Find all job titles in resume"""
         return []
 
-    def _extract_experience_dates(self, lines: List[str], text: str) -> List[Tuple]:
+    def _extract_experience_dates(self, lines: List[str]) -> List[Tuple]:
         """Extract date ranges from experience"""
         return []
 
@@ -638,15 +735,15 @@ class BRDCompliantResumeParser:
         """Extract location from line"""
         return ""
 
-    def _calculate_skill_experience(self, skill: str, lines: List[str], text: str) -> str:
+    def _calculate_skill_experience(self, skill: str, lines: List[str]) -> str:
         """Calculate skill experience duration"""
         return ""
 
-    def _get_skill_last_used(self, skill: str, lines: List[str], text: str) -> str:
+    def _get_skill_last_used(self, skill: str, lines: List[str]) -> str:
         """Get when skill was last used"""
         return ""
 
-    def _extract_skills_from_experience(self, lines: List[str], text: str) -> set:
+    def _extract_skills_from_experience(self, lines: List[str]) -> set:
         """Extract skills from experience descriptions"""
         return set()
 
@@ -690,6 +787,22 @@ class BRDCompliantResumeParser:
         """Parse project dates"""
         return {}
 
-    def _extract_projects_from_experience(self, lines: List[str], text: str) -> List[Dict[str, Any]]:
+    def _extract_projects_from_experience(self, lines: List[str]) -> List[Dict[str, Any]]:
         """Extract projects from experience descriptions"""
-        return []
\ No newline at end of file
+        return []
+
+
+# Parser held by each parse_batch worker process
+_worker_parser = None
+
+
+def _init_worker(parser: BRDCompliantResumeParser):
+    """Keep the parser sent to this worker process for all of its resumes"""
+    global _worker_parser
+    _worker_parser = parser
+
+
+def _parse_in_worker(doc: Tuple[str, str]) -> Dict[str, Any]:
+    """Parse one (text_content, filename) pair in a worker process"""
+    text_content, filename = doc
+    return _worker_parser.parse_resume_brd_compliant(text_content, filename)
@@ -26,6 +26,61 @@ class ComprehensiveResumeParser:
     - Improved skills categorization
     """
 
+    # Keyword tables shared by the line predicates (matched against lowercased text)
+    _NAME_REJECT_KEYWORDS = ('engineer', 'developer', 'manager', 'director', 'analyst', 'consultant')
+    _JOB_TITLE_KEYWORDS = (
+        'engineer', 'developer', 'manager', 'director', 'analyst', 'consultant',
+        'specialist', 'coordinator', 'administrator', 'lead', 'senior', 'junior',
+        'principal', 'chief', 'architect', 'designer', 'programmer', 'scientist'
+    )
+    _DESCRIPTION_PHRASES = ('specialized in', 'experienced', 'worked on', 'responsible for')
+    _DEGREE_KEYWORDS = (
+        'bachelor', 'master', 'phd', 'doctorate', 'associates', 'diploma',
+        'certificate', 'bs', 'ba', 'ms', 'ma', 'mba', 'md'
+    )
+    _SCHOOL_KEYWORDS = ('university', 'college', 'institute', 'school', 'academy')
+    # (value, keywords) in priority order; the first table row that matches wins
+    _JOB_CATEGORY_TABLE = (
+        ('Engineering', ('engineer', 'developer', 'programmer')),
+        ('Management', ('manager', 'director', 'lead')),
+        ('Analysis', ('analyst', 'scientist')),
+        ('Design', ('designer', 'architect')),
+    )
+    _JOB_LEVEL_TABLE = (
+        ('Senior', ('senior', 'sr', 'lead', 'principal', 'chief')),
+        ('Junior', ('junior', 'jr', 'associate', 'entry')),
+    )
+    # Section headers, matched as substrings of the stripped, uppercased line.
+    # Entries that contain another entry of the same tuple (e.g. 'TECHNICAL
+    # SKILLS' next to 'SKILLS') can never decide a match and are left out.
+    _NAME_SKIP_HEADERS = ('RESUME', 'CV', 'CURRICULUM VITAE', 'PROFILE')
+    _SUMMARY_HEADERS = ('SUMMARY', 'OBJECTIVE', 'PROFILE', 'OVERVIEW', 'ABOUT')
+    _EXPERIENCE_HEADERS = ('EXPERIENCE', 'EMPLOYMENT', 'CAREER HISTORY')
+    _EXPERIENCE_END_HEADERS = ('EDUCATION', 'SKILLS', 'PROJECTS', 'CERTIFICATIONS', 'ACHIEVEMENTS', 'AWARDS')
+    _EDUCATION_END_HEADERS = ('SKILLS', 'EXPERIENCE', 'PROJECTS', 'CERTIFICATIONS')
+    _PROJECTS_END_HEADERS = ('SKILLS', 'EXPERIENCE', 'EDUCATION', 'CERTIFICATIONS')
+    _SKILLS_HEADERS = ('SKILLS', 'TECHNOLOGIES', 'COMPETENCIES')
+    _SKILLS_END_HEADERS = ('EXPERIENCE', 'EDUCATION', 'PROJECTS', 'CERTIFICATIONS')
+    _ACHIEVEMENTS_HEADERS = ('ACHIEVEMENT', 'AWARD', 'HONOR', 'RECOGNITION', 'ACCOMPLISHMENT')
+    # Shared end markers for the certifications, achievements and languages sections
+    _SECTION_END_HEADERS = ('SKILLS', 'EXPERIENCE', 'EDUCATION', 'PROJECTS')
+    # Headers that only count when they are the whole line
+    _SUMMARY_END_LINES = frozenset({
+        'WORK EXPERIENCE', 'EMPLOYMENT HISTORY', 'EXPERIENCE',
+        'EDUCATION', 'SKILLS', 'TECHNICAL SKILLS', 'PROJECTS'
+    })
+    _JOB_TITLE_SECTION_LINES = frozenset({
+        'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS'
+    })
+    _PROJECT_TITLE_SECTION_LINES = frozenset({
+        'ACHIEVEMENTS', 'LANGUAGES', 'CERTIFICATIONS', 'SKILLS', 'EDUCATION'
+    })
+    # Month number keyed by the (unique) three-letter prefix of its name
+    _MONTH3 = {
+        'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+        'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+    }
+
     def __init__(self):
         self._init_patterns()
         logger.info("Comprehensive Resume Parser initialized - v1.0")
@@ -34,60 +89,97 @@ class ComprehensiveResumeParser:
         """Initialize comprehensive patterns"""
 
         # Enhanced email patterns
-        self.email_patterns = [
+        self.email_patterns = [re.compile(p, re.IGNORECASE) for p in [
             r'\b([a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,})\b'
+        ]]
+
+        # Phone numbers: one pass over the text. An optional +1 country code,
+        # optional parentheses around the area code and any run of separator
+        # characters between groups; the digit guards keep it from matching
+        # inside longer digit runs.
+        self.phone_re = re.compile(
+            r'(?:\+1[-.\s]*|(?<!\d))\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})(?!\d)'
+        )
+
+        # Social media profiles: one alternation, one named group per platform.
+        # Each named group wraps the profile URL prefix plus the username group,
+        # so match.lastgroup is the platform and the group after it the username.
+        social_media_prefixes = [
+            ('LinkedIn', r'linkedin\.com/in/|linkedin\.com/pub/|linkedin\.com/profile/view\?id='),
+            ('GitHub', r'github\.com/'),
+            ('Twitter', r'twitter\.com/'),
+            ('Facebook', r'facebook\.com/'),
+            ('Instagram', r'instagram\.com/'),
+            ('Behance', r'behance\.net/'),
+            ('Dribbble', r'dribbble\.com/'),
         ]
-
-        # Enhanced phone patterns (same as before but improved)
-        self.phone_patterns = [
-            r'\((\d{3})\)[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'\((\d{3})\)\s*(\d{3})[-.–]\s*(\d{4})',
-            r'(\d{3})[-.–\s]+(\d{3})[-.–\s]+(\d{4})',
-            r'\+1?\s*(\d{3})[-.–)\s]*(\d{3})[-.–)\s]*(\d{4})',
-            r'Phone[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'Tel[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'Mobile[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'Cell[:\s]*\(?(\d{3})\)?[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'[A-Za-z\s,]+\s+(\d{3})[-.–\s]*(\d{3})[-.–\s]*(\d{4})\s*$',
-            r'[0-9]{5}\s+(\d{3})[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'FL\s*(\d{3})\s*(\d{3})[-.–\s]*(\d{4})',
-            r'Email:\s*[^@\s]+@[^@\s]+\.[a-z]+\s+(\d{3})[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'(?:PO Box|Box|Address|Contact)[^0-9]*(\d{3})[-.–\s]*(\d{3})[-.–\s]*(\d{4})',
-            r'(?<!\d)(\d{3})[-.–\s]{0,3}(\d{3})[-.–\s]{0,3}(\d{4})(?!\d)',
-        ]
-
-        # Social media patterns
-        self.social_media_patterns = [
-            r'(?:linkedin\.com/in/|linkedin\.com/pub/|linkedin\.com/profile/view\?id=)([a-zA-Z0-9\-\.]+)',
-            r'(?:github\.com/)([a-zA-Z0-9\-\.]+)',
-            r'(?:twitter\.com/)([a-zA-Z0-9\-\.]+)',
-            r'(?:facebook\.com/)([a-zA-Z0-9\-\.]+)',
-            r'(?:instagram\.com/)([a-zA-Z0-9\-\.]+)',
-            r'(?:behance\.net/)([a-zA-Z0-9\-\.]+)',
-            r'(?:dribbble\.com/)([a-zA-Z0-9\-\.]+)',
-        ]
+        self.social_media_re = re.compile(
+            '|'.join(rf'(?P<{platform}>(?:{prefix})([a-zA-Z0-9\-\.]+))'
+                     for platform, prefix in social_media_prefixes),
+            re.IGNORECASE
+        )
+
+        # Name cleanup: punctuation, certifications/titles, and runs of whitespace
+        self.name_punct_re = re.compile(r'[,\.]')
+        self.name_cert_re = re.compile(
+            r'\b(MBA|MS|PhD|Dr|Mr|Mrs|Ms|Jr|Sr|III|IV|CISSP|CISM|CISA|CRISC|PMP|ISO\s*\d+|CIS|LA|PCI|QSA|PCIP|CCNA|MCP|Security\+|Network\+)\b',
+            re.IGNORECASE
+        )
+        self.whitespace_re = re.compile(r'\s+')
+        # Phone-number-like run used to rule out name and summary lines
+        self.phone_like_re = re.compile(r'\d{3}[-\s]\d{3}[-\s]\d{4}')
+
+        # Date patterns: month + year pairs, a bare year, and the case-sensitive
+        # markers that make a line read as a date range (full month names all
+        # start with their abbreviation, so the abbreviations cover them)
+        self.month_year_re = re.compile(
+            r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})',
+            re.IGNORECASE
+        )
+        self.year_re = re.compile(r'\d{4}')
+        self.date_indicator_re = re.compile(r'Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|Present|Current')
+
+        # Anything that rules a line out as a job title: a year, a month name,
+        # a company suffix or a street/address word
+        self.job_title_reject_re = re.compile(
+            r'\d{4}|\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December'
+            r'|Inc\.?|LLC|Corp\.?|Corporation|Company|Group|Technologies|Solutions|Systems'
+            r'|Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Drive|Dr\.?|Lane|Ln\.?|Boulevard|Blvd\.?)\b',
+            re.IGNORECASE
+        )
+
+        # Job titles mentioned in a professional summary
+        self.summary_title_patterns = [re.compile(p, re.IGNORECASE) for p in [
+            r'(Senior|Junior|Lead|Principal|Chief)\s+([A-Z][a-zA-Z\s]+(?:Engineer|Developer|Manager|Director|Analyst))',
+            r'([A-Z][a-zA-Z\s]+(?:Engineer|Developer|Manager|Director|Analyst))',
+            r'(Software|Data|Web|Mobile|Full[- ]?Stack|Front[- ]?End|Back[- ]?End)\s+(Engineer|Developer)',
+        ]]
 
         # Job title patterns
-        self.job_title_patterns = [
+        self.job_title_patterns = [re.compile(p) for p in [
             r'^([A-Z][a-zA-Z\s&\-\./]+(?:Engineer|Developer|Manager|Director|Analyst|Consultant|Specialist|Coordinator|Administrator|Lead|Senior|Junior|Principal))\s*$',
             r'^(Senior|Junior|Lead|Principal|Chief)\s+([A-Z][a-zA-Z\s&\-\./]+)\s*$',
             r'^([A-Z][a-zA-Z\s&\-\./]+)\s+(Engineer|Developer|Manager|Director|Analyst)\s*$',
-        ]
+        ]]
 
     def parse_resume(self, text: str, filename: str = "") -> Dict[str, Any]:
         """Parse resume text and return comprehensive structured data"""
         start_time = time.time()
 
+        # Split once; every extractor scans the same stripped/uppercased lines
+        lines = [line.strip() for line in text.split('\n')]
+        lines_upper = [line.upper() for line in lines]
+
         # Extract all sections with enhanced methods
-        contact_info = self._extract_contact_info_comprehensive(text, filename)
-        education = self._extract_education_comprehensive(text)
-        experience = self._extract_experience_comprehensive(text)
-        skills = self._extract_skills_comprehensive(text)
-        projects = self._extract_projects_comprehensive(text)
-        certifications = self._extract_certifications_comprehensive(text)
-        achievements = self._extract_achievements_comprehensive(text)
-        languages = self._extract_languages_comprehensive(text)
-        summary = self._extract_professional_summary(text)
+        contact_info = self._extract_contact_info_comprehensive(text, lines, lines_upper, filename)
+        education = self._extract_education_comprehensive(lines, lines_upper)
+        experience = self._extract_experience_comprehensive(lines, lines_upper)
+        skills = self._extract_skills_comprehensive(lines, lines_upper)
+        projects = self._extract_projects_comprehensive(lines, lines_upper)
+        certifications = self._extract_certifications_comprehensive(text, lines, lines_upper)
+        achievements = self._extract_achievements_comprehensive(text, lines, lines_upper)
+        languages = self._extract_languages_comprehensive(text, lines, lines_upper)
+        summary = self._extract_professional_summary(lines, lines_upper)
 
         processing_time = time.time() - start_time
 
@@ -106,7 +198,8 @@ class ComprehensiveResumeParser:
             'ExperienceMonths': self._calculate_total_experience_months(experience)
         }
 
-    def _extract_contact_info_comprehensive(self, text: str, filename: str = "") -> Dict[str, Any]:
+    def _extract_contact_info_comprehensive(self, text: str, lines: List[str], lines_upper: List[str],
+                                            filename: str = "") -> Dict[str, Any]:
         """Extract comprehensive contact information including middle names and social media"""
         contact_info = {
             'CandidateName': {'FormattedName': '', 'GivenName': '', 'MiddleName': '', 'FamilyName': ''},
@@ -116,17 +209,14 @@ class ComprehensiveResumeParser:
             'SocialMedia': []
         }
 
-        lines = text.split('\n')
-
         # Extract name (first few lines, enhanced for middle names)
         name_found = False
         for i, line in enumerate(lines[:10]):
-            line = line.strip()
             if not line or len(line) < 3:
                 continue
 
             # Skip header-like lines
-            if any(header in line.upper() for header in ['RESUME', 'CV', 'CURRICULUM VITAE', 'PROFILE']):
+            if any(header in lines_upper[i] for header in self._NAME_SKIP_HEADERS):
                 continue
 
             # Check if this looks like a name
@@ -138,43 +228,32 @@ class ComprehensiveResumeParser:
                     name_found = True
                     break
 
-        # Extract emails
+        # Extract emails (addresses compare case-insensitively; the first spelling is kept)
+        seen_emails = set()
         for pattern in self.email_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    email = match[0]
-                else:
-                    email = match
-                if email not in [e['Address'] for e in contact_info['EmailAddresses']]:
+            for match in pattern.finditer(text):
+                email = match.group(1)
+                email_key = email.lower()
+                if email_key not in seen_emails:
+                    seen_emails.add(email_key)
                     contact_info['EmailAddresses'].append({'Address': email})
 
         # Extract phone numbers
-        for pattern in self.phone_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    # Reconstruct phone number from groups
-                    if len(match) >= 3:
-                        phone = f"({match[0]}) {match[1]}-{match[2]}"
-                    else:
-                        phone = ''.join(match)
-                else:
-                    phone = match
-
-                if phone not in [p['Raw'] for p in contact_info['Telephones']]:
-                    contact_info['Telephones'].append({'Raw': phone})
+        seen_phones = set()
+        for match in self.phone_re.finditer(text):
+            phone = f"({match[1]}) {match[2]}-{match[3]}"
+            if phone not in seen_phones:
+                seen_phones.add(phone)
+                contact_info['Telephones'].append({'Raw': phone})
 
         # Extract social media links
-        for pattern in self.social_media_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            for match in matches:
-                platform = self._identify_social_platform(pattern)
-                contact_info['SocialMedia'].append({
-                    'Platform': platform,
-                    'URL': match,
-                    'Username': match
-                })
+        for match in self.social_media_re.finditer(text):
+            username = match.group(match.lastindex + 1)
+            contact_info['SocialMedia'].append({
+                'Platform': match.lastgroup,
+                'URL': username,
+                'Username': username
+            })
 
         # Extract location
         location = self._extract_location(text)
@@ -185,14 +264,13 @@ class ComprehensiveResumeParser:
     def _parse_name_components(self, name_line: str) -> Dict[str, str]:
         """Parse name into components including middle name"""
         # Clean the name line
-        name_clean = re.sub(r'[,\.]', '', name_line).strip()
+        name_clean = self.name_punct_re.sub('', name_line).strip()
 
         # Remove common certifications and titles
-        cert_pattern = r'\b(MBA|MS|PhD|Dr|Mr|Mrs|Ms|Jr|Sr|III|IV|CISSP|CISM|CISA|CRISC|PMP|ISO\s*\d+|CIS|LA|PCI|QSA|PCIP|CCNA|MCP|Security\+|Network\+)\b'
-        name_clean = re.sub(cert_pattern, '', name_clean, flags=re.IGNORECASE).strip()
+        name_clean = self.name_cert_re.sub('', name_clean).strip()
 
         # Remove multiple spaces
-        name_clean = re.sub(r'\s+', ' ', name_clean)
+        name_clean = self.whitespace_re.sub(' ', name_clean)
 
         parts = name_clean.split()
 
@@ -219,20 +297,10 @@ class ComprehensiveResumeParser:
         """Check if a line looks like a person's name"""
         line = line.strip()
 
-        # Skip if contains email or phone
-        if '@' in line or re.search(r'\d{3}[-\s]\d{3}[-\s]\d{4}', line):
-            return False
+        # Every check below rejects on its own, so the cheap structural ones
+        # run first and most body lines never reach the keyword/regex checks.
 
-        # Skip if all caps (likely headers)
-        if line.isupper() and len(line) > 10:
-            return False
-
-        # Skip if contains job title keywords
-        job_keywords = ['engineer', 'developer', 'manager', 'director', 'analyst', 'consultant']
-        if any(keyword in line.lower() for keyword in job_keywords):
-            return False
-
-        # Should have 1-4 words, starting with capital letters
+        # Should have 1-6 words, starting with capital letters
         words = line.split()
         if len(words) < 1 or len(words) > 6:
             return False
@@ -244,47 +312,51 @@ class ComprehensiveResumeParser:
             if not word[0].isupper():
                 return False
 
+        # Skip if all caps (likely headers); the length test is the cheaper one
+        if len(line) > 10 and line.isupper():
+            return False
+
+        # Skip if contains email or phone
+        if '@' in line or self.phone_like_re.search(line):
+            return False
+
+        # Skip if contains job title keywords
+        line_lower = line.lower()
+        if any(keyword in line_lower for keyword in self._NAME_REJECT_KEYWORDS):
+            return False
+
         return True
 
-    def _extract_professional_summary(self, text: str) -> Dict[str, Any]:
+    def _extract_professional_summary(self, lines: List[str], lines_upper: List[str]) -> Dict[str, Any]:
         """Extract professional summary/objective section"""
-        lines = text.split('\n')
-        summary_keywords = [
-            'PROFESSIONAL SUMMARY', 'SUMMARY', 'OBJECTIVE', 'PROFILE',
-            'CAREER SUMMARY', 'EXECUTIVE SUMMARY', 'OVERVIEW', 'ABOUT'
-        ]
-
-        summary_text = ""
+        summary_parts = []
         in_summary = False
 
-        for i, line in enumerate(lines):
-            line_upper = line.strip().upper()
-
+        for line, line_upper in zip(lines, lines_upper):
             # Check if this is a summary section header
-            if any(keyword in line_upper for keyword in summary_keywords):
+            if any(keyword in line_upper for keyword in self._SUMMARY_HEADERS):
                 in_summary = True
                 continue
 
             # Check if we've reached another section
-            if in_summary and line_upper and line_upper in [
-                'WORK EXPERIENCE', 'EMPLOYMENT HISTORY', 'EXPERIENCE',
-                'EDUCATION', 'SKILLS', 'TECHNICAL SKILLS', 'PROJECTS'
-            ]:
+            if in_summary and line_upper in self._SUMMARY_END_LINES:
                 break
 
             # Collect summary text
-            if in_summary and line.strip():
-                summary_text += line.strip() + " "
+            if in_summary and line:
+                summary_parts.append(line)
+
+        summary_text = ' '.join(summary_parts)
 
         # Also look for introductory paragraphs near the top
         if not summary_text:
-            for i, line in enumerate(lines[:15]):
-                if (len(line.strip()) > 50 and
-                    not line.strip().isupper() and
+            for line in lines[:15]:
+                if (len(line) > 50 and
+                    not line.isupper() and
                     not '@' in line and
-                    not re.search(r'\d{3}[-\s]\d{3}[-\s]\d{4}', line)):
+                    not self.phone_like_re.search(line)):
                     # This might be a summary
-                    summary_text = line.strip()
+                    summary_text = line
                     break
 
         return {
@@ -297,20 +369,10 @@ class ComprehensiveResumeParser:
         """Extract job titles mentioned in summary"""
         titles = []
 
-        # Common title patterns
-        title_patterns = [
-            r'(Senior|Junior|Lead|Principal|Chief)\s+([A-Z][a-zA-Z\s]+(?:Engineer|Developer|Manager|Director|Analyst))',
-            r'([A-Z][a-zA-Z\s]+(?:Engineer|Developer|Manager|Director|Analyst))',
-            r'(Software|Data|Web|Mobile|Full[- ]?Stack|Front[- ]?End|Back[- ]?End)\s+(Engineer|Developer)',
-        ]
-
-        for pattern in title_patterns:
-            matches = re.findall(pattern, summary_text, re.IGNORECASE)
-            for match in matches:
-                if isinstance(match, tuple):
-                    title = ' '.join(match).strip()
-                else:
-                    title = match.strip()
+        for pattern in self.summary_title_patterns:
+            for match in pattern.finditer(summary_text):
+                # Multi-group patterns (seniority + role) are joined with a space
+                title = ' '.join(match.groups()).strip()
                 if title and title not in titles:
                     titles.append(title)
 
@@ -332,21 +394,16 @@ class ComprehensiveResumeParser:
 
         return None
 
-    def _extract_experience_comprehensive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_experience_comprehensive(self, lines: List[str], lines_upper: List[str]) -> List[Dict[str, Any]]:
         """Extract work experience with comprehensive job title detection"""
         positions = []
-        lines = text.split('\n')
 
         # Find experience section
         experience_start = -1
         experience_end = -1
 
-        for i, line in enumerate(lines):
-            line_upper = line.strip().upper()
-            if any(header in line_upper for header in [
-                'WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE', 'EMPLOYMENT HISTORY',
-                'EXPERIENCE', 'CAREER HISTORY', 'EMPLOYMENT'
-            ]):
+        for i, line_upper in enumerate(lines_upper):
+            if any(header in line_upper for header in self._EXPERIENCE_HEADERS):
                 experience_start = i + 1
                 break
 
@@ -355,11 +412,8 @@ class ComprehensiveResumeParser:
 
         # Find end of experience section
         for i in range(experience_start, len(lines)):
-            line_upper = lines[i].strip().upper()
-            if any(header in line_upper for header in [
-                'EDUCATION', 'SKILLS', 'TECHNICAL SKILLS', 'PROJECTS',
-                'CERTIFICATIONS', 'ACHIEVEMENTS', 'AWARDS'
-            ]):
+            line_upper = lines_upper[i]
+            if any(header in line_upper for header in self._EXPERIENCE_END_HEADERS):
                 experience_end = i
                 break
 
@@ -370,21 +424,35 @@ class ComprehensiveResumeParser:
 
         # Parse positions with improved logic
         current_position = None
+        description_parts = []
         i = 0
 
-        while i < len(experience_lines):
-            line = experience_lines[i].strip()
+        # Bind the per-line helpers once; the loop below calls them for every line
+        looks_like_job_title = self._looks_like_job_title
+        looks_like_company_location = self._looks_like_company_location
+        parse_company_location = self._parse_company_location
+        looks_like_date_range = self._looks_like_date_range
+        parse_date_range = self._parse_date_range
+        classify_job_title = self._classify_job_title
+        parse_location = self._parse_location
+        num_lines = len(experience_lines)
+
+        while i < num_lines:
+            line = experience_lines[i]
 
             if not line:
                 i += 1
                 continue
 
             # Check if this line is a job title (usually appears first)
-            if self._looks_like_job_title(line):
+            if looks_like_job_title(line):
                 # Start new position
                 if current_position:
+                    current_position['Description'] = ' '.join(description_parts)
                     positions.append(current_position)
+                description_parts = []
 
+                job_category, job_level = classify_job_title(line)
                 current_position = {
                     'JobTitle': {'Raw': line},
                     'Employer': {'Name': {'Raw': ''}},
@@ -393,43 +461,41 @@ class ComprehensiveResumeParser:
                     'EndDate': {'Date': ''},
                     'IsCurrent': False,
                     'Description': '',
-                    'JobCategory': self._categorize_job_title(line),
-                    'JobLevel': self._determine_job_level(line)
+                    'JobCategory': job_category,
+                    'JobLevel': job_level
                 }
 
-                # Look for company/location in next few lines
-                for j in range(i + 1, min(i + 4, len(experience_lines))):
-                    next_line = experience_lines[j].strip()
-                    if self._looks_like_company_location(next_line):
-                        company, location = self._parse_company_location(next_line)
+                # Look for company/location and dates in the next few lines;
+                # the first line matching each one wins
+                found_company = found_dates = False
+                for j in range(i + 1, min(i + 4, num_lines)):
+                    next_line = experience_lines[j]
+                    if not found_company and looks_like_company_location(next_line):
+                        found_company = True
+                        company, location = parse_company_location(next_line)
                         current_position['Employer']['Name']['Raw'] = company
                         if location:
-                            loc_parts = self._parse_location(location)
+                            loc_parts = parse_location(location)
                             current_position['Location'] = loc_parts
-                        break
-
-                # Look for dates in next few lines
-                for j in range(i + 1, min(i + 4, len(experience_lines))):
-                    next_line = experience_lines[j].strip()
-                    if self._looks_like_date_range(next_line):
-                        start_date, end_date, is_current = self._parse_date_range(next_line)
+                    if not found_dates and looks_like_date_range(next_line):
+                        found_dates = True
+                        start_date, end_date, is_current = parse_date_range(next_line)
                         current_position['StartDate']['Date'] = start_date
                         current_position['EndDate']['Date'] = end_date
                         current_position['IsCurrent'] = is_current
+                    if found_company and found_dates:
                         break
 
             # Collect description lines
             elif current_position and (line.startswith('•') or line.startswith('-') or
                                     line.startswith('*') or len(line) > 20):
-                if current_position['Description']:
-                    current_position['Description'] += ' ' + line
-                else:
-                    current_position['Description'] = line
+                description_parts.append(line)
 
             i += 1
 
         # Add last position
         if current_position:
+            current_position['Description'] = ' '.join(description_parts)
             positions.append(current_position)
 
         return positions
@@ -442,38 +508,25 @@ class ComprehensiveResumeParser:
         if len(line) < 3:
             return False
 
-        # Skip if contains dates
-        if re.search(r'\b(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\b|\d{4}', line, re.IGNORECASE):
-            return False
-
-        # Skip if contains company indicators
-        if re.search(r'\b(Inc\.?|LLC|Corp\.?|Corporation|Company|Group|Technologies|Solutions|Systems)\b', line, re.IGNORECASE):
-            return False
-
-        # Skip if contains location indicators
-        if re.search(r'\b(Street|St\.?|Avenue|Ave\.?|Road|Rd\.?|Drive|Dr\.?|Lane|Ln\.?|Boulevard|Blvd\.?)\b', line, re.IGNORECASE):
-            return False
-
         # Skip if starts with bullets
         if line.startswith(('•', '-', '*', '○')):
             return False
 
         # Skip if it's a section header
-        if line.upper() in ['WORK EXPERIENCE', 'PROFESSIONAL EXPERIENCE', 'EDUCATION', 'SKILLS', 'PROJECTS']:
+        if line.upper() in self._JOB_TITLE_SECTION_LINES:
+            return False
+
+        # Skip if contains dates, company indicators or location indicators
+        if self.job_title_reject_re.search(line):
             return False
 
         # Skip if it looks like a description or summary
-        if any(word in line.lower() for word in ['specialized in', 'experienced', 'worked on', 'responsible for']):
+        line_lower = line.lower()
+        if any(word in line_lower for word in self._DESCRIPTION_PHRASES):
             return False
 
         # Check for common job title patterns
-        job_title_keywords = [
-            'engineer', 'developer', 'manager', 'director', 'analyst', 'consultant',
-            'specialist', 'coordinator', 'administrator', 'lead', 'senior', 'junior',
-            'principal', 'chief', 'architect', 'designer', 'programmer', 'scientist'
-        ]
-
-        if any(keyword in line.lower() for keyword in job_title_keywords):
+        if any(keyword in line_lower for keyword in self._JOB_TITLE_KEYWORDS):
             return True
 
         # Check if it's in title case and reasonable length
@@ -496,7 +549,7 @@ class ComprehensiveResumeParser:
             return False
 
         # Should not contain dates
-        if re.search(r'\d{4}', line):
+        if self.year_re.search(line):
             return False
 
         return True
@@ -511,93 +564,65 @@ class ComprehensiveResumeParser:
     def _looks_like_date_range(self, line: str) -> bool:
         """Check if a line looks like a date range"""
         # Should contain year
-        if not re.search(r'\d{4}', line):
+        if not self.year_re.search(line):
             return False
 
         # Should contain date patterns
-        date_indicators = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec',
-                          'January', 'February', 'March', 'April', 'May', 'June', 'July', 'August',
-                          'September', 'October', 'November', 'December', 'Present', 'Current']
-
-        return any(indicator in line for indicator in date_indicators)
+        return self.date_indicator_re.search(line) is not None
 
     def _parse_date_range(self, line: str) -> tuple:
         """Parse start date, end date, and current status from a line"""
-        is_current = 'present' in line.lower() or 'current' in line.lower()
+        line_lower = line.lower()
+        is_current = 'present' in line_lower or 'current' in line_lower
+
+        # One pass collects every month/year pair on the line
+        dates = self.month_year_re.findall(line)
 
         # Extract start date
-        start_match = re.search(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})', line, re.IGNORECASE)
         start_date = ''
-        if start_match:
-            month = start_match.group(1)
-            year = start_match.group(2)
+        if dates:
+            month, year = dates[0]
             start_date = f"{year}-{self._month_to_number(month):02d}-01"
 
         # Extract end date
         end_date = 'Present' if is_current else ''
-        if not is_current:
-            # Look for second date
-            dates = re.findall(r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec|January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{4})', line, re.IGNORECASE)
-            if len(dates) >= 2:
-                month = dates[1][0]
-                year = dates[1][1]
-                end_date = f"{year}-{self._month_to_number(month):02d}-01"
+        if not is_current and len(dates) >= 2:
+            # Second date on the line is the end date
+            month, year = dates[1]
+            end_date = f"{year}-{self._month_to_number(month):02d}-01"
 
         return start_date, end_date, is_current
 
     def _month_to_number(self, month: str) -> int:
-        """Convert month name to number"""
-        month_map = {
-            'jan': 1, 'january': 1,
-            'feb': 2, 'february': 2,
-            'mar': 3, 'march': 3,
-            'apr': 4, 'april': 4,
-            'may': 5,
-            'jun': 6, 'june': 6,
-            'jul': 7, 'july': 7,
-            'aug': 8, 'august': 8,
-            'sep': 9, 'september': 9,
-            'oct': 10, 'october': 10,
-            'nov': 11, 'november': 11,
-            'dec': 12, 'december': 12
-        }
-        return month_map.get(month.lower(), 1)
+        """Convert month name (full or abbreviated) to number"""
+        return self._MONTH3.get(month[:3].lower(), 1)
 
-    def _categorize_job_title(self, title: str) -> str:
-        """Categorize job title"""
+    def _classify_job_title(self, title: str) -> tuple:
+        """Return (category, level) for a job title, lowercasing it once"""
         title_lower = title.lower()
 
-        if any(word in title_lower for word in ['engineer', 'developer', 'programmer']):
-            return 'Engineering'
-        elif any(word in title_lower for word in ['manager', 'director', 'lead']):
-            return 'Management'
-        elif any(word in title_lower for word in ['analyst', 'scientist']):
-            return 'Analysis'
-        elif any(word in title_lower for word in ['designer', 'architect']):
-            return 'Design'
-        else:
-            return 'Other'
+        category = next((value for value, words in self._JOB_CATEGORY_TABLE
+                         if any(word in title_lower for word in words)), 'Other')
+        level = next((value for value, words in self._JOB_LEVEL_TABLE
+                      if any(word in title_lower for word in words)), 'Mid-Level')
+        return category, level
+
+    def _categorize_job_title(self, title: str) -> str:
+        """Categorize job title"""
+        return self._classify_job_title(title)[0]
 
     def _determine_job_level(self, title: str) -> str:
         """Determine job level from title"""
-        title_lower = title.lower()
-
-        if any(word in title_lower for word in ['senior', 'sr', 'lead', 'principal', 'chief']):
-            return 'Senior'
-        elif any(word in title_lower for word in ['junior', 'jr', 'associate', 'entry']):
-            return 'Junior'
-        else:
-            return 'Mid-Level'
+        return self._classify_job_title(title)[1]
 
-    def _extract_education_comprehensive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_education_comprehensive(self, lines: List[str], lines_upper: List[str]) -> List[Dict[str, Any]]:
         """Extract comprehensive education information"""
         education_entries = []
-        lines = text.split('\n')
 
         # Find education section
         education_start = -1
-        for i, line in enumerate(lines):
-            if 'EDUCATION' in line.upper():
+        for i, line_upper in enumerate(lines_upper):
+            if 'EDUCATION' in line_upper:
                 education_start = i + 1
                 break
 
@@ -607,10 +632,8 @@ class ComprehensiveResumeParser:
         # Find end of education section
         education_end = len(lines)
         for i in range(education_start, len(lines)):
-            line_upper = lines[i].strip().upper()
-            if any(header in line_upper for header in [
-                'SKILLS', 'EXPERIENCE', 'PROJECTS', 'CERTIFICATIONS'
-            ]):
+            line_upper = lines_upper[i]
+            if any(header in line_upper for header in self._EDUCATION_END_HEADERS):
                 education_end = i
                 break
 
@@ -618,13 +641,17 @@ class ComprehensiveResumeParser:
 
         current_entry = None
 
+        # Bind the per-line predicates once for the loop below
+        looks_like_degree = self._looks_like_degree
+        looks_like_school = self._looks_like_school
+        year_search = self.year_re.search
+
         for line in education_lines:
-            line = line.strip()
             if not line:
                 continue
 
             # Check if this is a degree line
-            if self._looks_like_degree(line):
+            if looks_like_degree(line):
                 if current_entry:
                     education_entries.append(current_entry)
 
@@ -638,11 +665,11 @@ class ComprehensiveResumeParser:
                 }
 
             # Check if this is a school line
-            elif current_entry and self._looks_like_school(line):
+            elif current_entry and looks_like_school(line):
                 current_entry['SchoolName']['Raw'] = line
 
             # Check if this is a date line
-            elif current_entry and re.search(r'\d{4}', line):
+            elif current_entry and year_search(line):
                 dates = self._parse_education_dates(line)
                 current_entry['StartDate']['Date'] = dates['start']
                 current_entry['EndDate']['Date'] = dates['end']
@@ -660,30 +687,21 @@ class ComprehensiveResumeParser:
 
     def _looks_like_degree(self, line: str) -> bool:
         """Check if line looks like a degree"""
-        degree_keywords = [
-            'bachelor', 'master', 'phd', 'doctorate', 'associates', 'diploma',
-            'certificate', 'bs', 'ba', 'ms', 'ma', 'mba', 'phd', 'md'
-        ]
+        line_lower = line.lower()
 
         # Should contain degree keywords and not contain school indicators
-        has_degree = any(keyword in line.lower() for keyword in degree_keywords)
-        has_school = any(keyword in line.lower() for keyword in ['university', 'college', 'institute', 'school', 'academy'])
+        has_degree = any(keyword in line_lower for keyword in self._DEGREE_KEYWORDS)
+        has_school = any(keyword in line_lower for keyword in self._SCHOOL_KEYWORDS)
 
         return has_degree and not has_school
 
     def _looks_like_school(self, line: str) -> bool:
         """Check if line looks like a school name"""
-        school_keywords = [
-            'university', 'college', 'institute', 'school', 'academy'
-        ]
+        line_lower = line.lower()
 
         # Should contain school keywords and not contain degree indicators
-        has_school = any(keyword in line.lower() for keyword in school_keywords)
-        degree_keywords = [
-            'bachelor', 'master', 'phd', 'doctorate', 'associates', 'diploma',
-            'certificate', 'bs', 'ba', 'ms', 'ma', 'mba', 'phd', 'md'
-        ]
-        has_degree = any(keyword in line.lower() for keyword in degree_keywords)
+        has_school = any(keyword in line_lower for keyword in self._SCHOOL_KEYWORDS)
+        has_degree = any(keyword in line_lower for keyword in self._DEGREE_KEYWORDS)
 
         return has_school and not has_degree
 
@@ -734,15 +752,14 @@ class ComprehensiveResumeParser:
         else:
             return {'start': '', 'end': ''}
 
-    def _extract_projects_comprehensive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_projects_comprehensive(self, lines: List[str], lines_upper: List[str]) -> List[Dict[str, Any]]:
         """Extract comprehensive project information"""
         projects = []
-        lines = text.split('\n')
 
         # Find projects section
         projects_start = -1
-        for i, line in enumerate(lines):
-            if 'PROJECT' in line.upper():
+        for i, line_upper in enumerate(lines_upper):
+            if 'PROJECT' in line_upper:
                 projects_start = i + 1
                 break
 
@@ -752,26 +769,26 @@ class ComprehensiveResumeParser:
         # Find end of projects section
         projects_end = len(lines)
         for i in range(projects_start, len(lines)):
-            line_upper = lines[i].strip().upper()
-            if any(header in line_upper for header in [
-                'SKILLS', 'EXPERIENCE', 'EDUCATION', 'CERTIFICATIONS'
-            ]):
+            line_upper = lines_upper[i]
+            if any(header in line_upper for header in self._PROJECTS_END_HEADERS):
                 projects_end = i
                 break
 
         project_lines = lines[projects_start:projects_end]
 
         current_project = None
+        description_parts = []
 
         for line in project_lines:
-            line = line.strip()
             if not line:
                 continue
 
             # Check if this is a project title
             if self._looks_like_project_title(line):
                 if current_project:
+                    current_project['Description'] = ' '.join(description_parts)
                     projects.append(current_project)
+                description_parts = []
 
                 current_project = {
                     'Name': line,
@@ -786,10 +803,7 @@ class ComprehensiveResumeParser:
             # Collect project description
             elif current_project:
                 if line.startswith(('•', '-', '*')):
-                    if current_project['Description']:
-                        current_project['Description'] += ' ' + line
-                    else:
-                        current_project['Description'] = line
+                    description_parts.append(line)
 
                 # Look for technologies
                 if 'technolog' in line.lower() or 'tool' in line.lower():
@@ -797,6 +811,7 @@ class ComprehensiveResumeParser:
                     current_project['Technologies'].extend(techs)
 
         if current_project:
+            current_project['Description'] = ' '.join(description_parts)
             projects.append(current_project)
 
         return projects
@@ -812,7 +827,7 @@ class ComprehensiveResumeParser:
             return False
 
         # Should not be a section header
-        if line.upper() in ['ACHIEVEMENTS', 'LANGUAGES', 'CERTIFICATIONS', 'SKILLS', 'EDUCATION']:
+        if line.upper() in self._PROJECT_TITLE_SECTION_LINES:
             return False
 
         # Should not contain obvious description keywords
@@ -843,19 +858,15 @@ class ComprehensiveResumeParser:
 
         return technologies
 
-    def _extract_skills_comprehensive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_skills_comprehensive(self, lines: List[str], lines_upper: List[str]) -> List[Dict[str, Any]]:
         """Extract comprehensive skills information"""
         skills = []
 
         # Find skills section
-        lines = text.split('\n')
         skills_start = -1
 
-        for i, line in enumerate(lines):
-            line_upper = line.strip().upper()
-            if any(keyword in line_upper for keyword in [
-                'SKILLS', 'TECHNICAL SKILLS', 'TECHNOLOGIES', 'COMPETENCIES'
-            ]):
+        for i, line_upper in enumerate(lines_upper):
+            if any(keyword in line_upper for keyword in self._SKILLS_HEADERS):
                 skills_start = i + 1
                 break
 
@@ -865,10 +876,8 @@ class ComprehensiveResumeParser:
         # Find end of skills section
         skills_end = len(lines)
         for i in range(skills_start, len(lines)):
-            line_upper = lines[i].strip().upper()
-            if any(header in line_upper for header in [
-                'EXPERIENCE', 'EDUCATION', 'PROJECTS', 'CERTIFICATIONS'
-            ]):
+            line_upper = lines_upper[i]
+            if any(header in line_upper for header in self._SKILLS_END_HEADERS):
                 skills_end = i
                 break
 
@@ -876,7 +885,6 @@ class ComprehensiveResumeParser:
 
         # Parse skills from each line
         for line in skills_lines:
-            line = line.strip()
             if not line:
                 continue
 
@@ -939,15 +947,15 @@ class ComprehensiveResumeParser:
         else:
             return 'Technical Skill'
 
-    def _extract_certifications_comprehensive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_certifications_comprehensive(self, text: str, lines: List[str],
+                                              lines_upper: List[str]) -> List[Dict[str, Any]]:
         """Extract comprehensive certification information"""
         certifications = []
-        lines = text.split('\n')
 
         # Find certifications section
         cert_start = -1
-        for i, line in enumerate(lines):
-            if 'CERTIFICATION' in line.upper():
+        for i, line_upper in enumerate(lines_upper):
+            if 'CERTIFICATION' in line_upper:
                 cert_start = i + 1
                 break
 
@@ -977,17 +985,14 @@ class ComprehensiveResumeParser:
         # Parse certifications from dedicated section
         cert_end = len(lines)
         for i in range(cert_start, len(lines)):
-            line_upper = lines[i].strip().upper()
-            if any(header in line_upper for header in [
-                'SKILLS', 'EXPERIENCE', 'EDUCATION', 'PROJECTS'
-            ]):
+            line_upper = lines_upper[i]
+            if any(header in line_upper for header in self._SECTION_END_HEADERS):
                 cert_end = i
                 break
 
         cert_lines = lines[cert_start:cert_end]
 
         for line in cert_lines:
-            line = line.strip()
             if not line:
                 continue
 
@@ -1046,19 +1051,16 @@ class ComprehensiveResumeParser:
         year_match = re.search(r'\b(19|20)\d{2}\b', cert_context)
         return year_match.group(0) if year_match else ''
 
-    def _extract_achievements_comprehensive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_achievements_comprehensive(self, text: str, lines: List[str],
+                                            lines_upper: List[str]) -> List[Dict[str, Any]]:
         """Extract comprehensive achievements information"""
         achievements = []
 
         # Find achievements section
-        lines = text.split('\n')
         achievements_start = -1
 
-        for i, line in enumerate(lines):
-            line_upper = line.strip().upper()
-            if any(keyword in line_upper for keyword in [
-                'ACHIEVEMENT', 'AWARD', 'HONOR', 'RECOGNITION', 'ACCOMPLISHMENT'
-            ]):
+        for i, line_upper in enumerate(lines_upper):
+            if any(keyword in line_upper for keyword in self._ACHIEVEMENTS_HEADERS):
                 achievements_start = i + 1
                 break
 
@@ -1066,17 +1068,14 @@ class ComprehensiveResumeParser:
             # Parse achievements from dedicated section
             achievements_end = len(lines)
             for i in range(achievements_start, len(lines)):
-                line_upper = lines[i].strip().upper()
-                if any(header in line_upper for header in [
-                    'SKILLS', 'EXPERIENCE', 'EDUCATION', 'PROJECTS'
-                ]):
+                line_upper = lines_upper[i]
+                if any(header in line_upper for header in self._SECTION_END_HEADERS):
                     achievements_end = i
                     break
 
             achievement_lines = lines[achievements_start:achievements_end]
 
             for line in achievement_lines:
-                line = line.strip()
                 if line and not line.startswith(('•', '-', '*')):
                     achievements.append({
                         'Title': line,
@@ -1114,16 +1113,15 @@ class ComprehensiveResumeParser:
         year_match = re.search(r'\b(19|20)\d{2}\b', text)
         return year_match.group(0) if year_match else ''
 
-    def _extract_languages_comprehensive(self, text: str) -> List[Dict[str, Any]]:
+    def _extract_languages_comprehensive(self, text: str, lines: List[str],
+                                         lines_upper: List[str]) -> List[Dict[str, Any]]:
         """Extract comprehensive language information"""
         languages = []
 
         # Find languages section
-        lines = text.split('\n')
         languages_start = -1
 
-        for i, line in enumerate(lines):
-            line_upper = line.strip().upper()
+        for i, line_upper in enumerate(lines_upper):
             if 'LANGUAGE' in line_upper:
                 languages_start = i + 1
                 break
@@ -1148,17 +1146,14 @@ class ComprehensiveResumeParser:
         # Parse languages from dedicated section
         languages_end = len(lines)
         for i in range(languages_start, len(lines)):
-            line_upper = lines[i].strip().upper()
-            if any(header in line_upper for header in [
-                'SKILLS', 'EXPERIENCE', 'EDUCATION', 'PROJECTS'
-            ]):
+            line_upper = lines_upper[i]
+            if any(header in line_upper for header in self._SECTION_END_HEADERS):
                 languages_end = i
                 break
 
         language_lines = lines[languages_start:languages_end]
 
         for line in language_lines:
-            line = line.strip()
             if not line:
                 continue
 
@@ -1195,25 +1190,6 @@ class ComprehensiveResumeParser:
 
         return None
 
-    def _identify_social_platform(self, pattern: str) -> str:
-        """Identify social media platform from pattern"""
-        if 'linkedin' in pattern:
-            return 'LinkedIn'
-        elif 'github' in pattern:
-            return 'GitHub'
-        elif 'twitter' in pattern:
-            return 'Twitter'
-        elif 'facebook' in pattern:
-            return 'Facebook'
-        elif 'instagram' in pattern:
-            return 'Instagram'
-        elif 'behance' in pattern:
-            return 'Behance'
-        elif 'dribbble' in pattern:
-            return 'Dribbble'
-        else:
-            return 'Unknown'
-
     def _extract_location(self, text: str) -> Dict[str, Any]:
         """Extract location information"""
         # Look for common location patterns
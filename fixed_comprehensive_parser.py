@@ -9,7 +9,8 @@ import json
 import time
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -1772,6 +1773,12 @@ class FixedComprehensiveParser:
 
     def _parse_degree_string(self, degree_str: str) -> Dict[str, Any]:
         """Parse degree information from degree string"""
+        return dict(self._parse_degree_fields(degree_str))
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_degree_fields(degree_str: str) -> Tuple[Tuple[str, str], ...]:
+        """Cached, hashable form of _parse_degree_string (degree strings repeat across resumes)"""
 
         # Clean the degree string first
         cleaned_degree = degree_str.strip()
@@ -1817,7 +1824,7 @@ class FixedComprehensiveParser:
             result['Major'] = in_match.group(1).strip()
             result['FieldOfStudy'] = in_match.group(1).strip()
 
-        return result
+        return tuple(result.items())
 
     def _parse_education_line(self, line: str) -> Dict[str, Any]:
         """Parse a single education line"""